@@ -13,46 +13,556 @@ Example:
 
 # Python standard library
 from shutil import copy
-import json
+import functools
 import os
-import subprocess
+import stat
 import sys
-import textwrap
 
 # 3rd party imports from pypi
 import argparse
 from ccbr_tools.pipeline.util import (
-    get_hpcname,
     get_tmp_dir,
-    get_genomes_list,
     check_python_version,
     _cp_r_safe_,
 )
 from ccbr_tools.pipeline.cache import get_sif_cache_dir, image_cache
 
 # local imports
-from .run import run
-from .dryrun import dryrun
-from .gui import launch_gui
 from .conditions import fatal
-from .util import renee_base, get_version
-from .orchestrate import orchestrate
+from .util import (
+    renee_base,
+    get_version,
+    get_genomes_list,
+    get_hpcname,
+    realpath,
+)
 
 # Pipeline Metadata and globals
-RENEE_PATH = os.path.dirname(
-    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-)
-__version__ = get_version()
 __home__ = os.path.dirname(os.path.abspath(__file__))
+RENEE_PATH = os.path.dirname(os.path.dirname(__home__))
 _name = os.path.basename(sys.argv[0])
 _description = "a highly-reproducible RNA-seq pipeline"
 check_python_version()
 
 
+# Help messages for the required options and epilogs of the sub-commands,
+# stored without indentation and formatted with Colors when a parser is built.
+# argparse does not support named subparser groups, see parsed_arguments()
+_run_options_help = """
+{1}{0} {3}run{4}: {1} Runs the data-processing and quality-control pipeline.{4}
+
+{1}{2}Synopsis:{4}
+  $ {0} run [--help] \\
+                      [--small-rna] [--star-2-pass-basic] \\
+                      [--dry-run] [--mode {{slurm, local}}] \\
+                      [--shared-resources SHARED_RESOURCES] \\
+                      [--singularity-cache SINGULARITY_CACHE] \\
+                      [--sif-cache SIF_CACHE] \\
+                      [--tmp-dir TMP_DIR] \\
+                      [--wait] \\
+                      [--create-nidap-folder] \\
+                      [--threads THREADS] \\
+                      --input INPUT [INPUT ...] \\
+                      --output OUTPUT \\
+                      --genome {{hg38_36, mm10_M21, custom.json, ...}}
+
+{1}{2}Description:{4}
+  To run the pipeline with with your data, please provide a space separated
+list of FastQs (globbing is supported), an output directory to store results,
+and a reference genome.
+
+  Optional arguments are shown in square brackets above. Please visit our docs
+at "https://CCBR.github.io/RENEE/" for more information, examples, and
+guides.
+
+{1}{2}Required arguments:{4}
+  --input INPUT [INPUT ...]
+                        Input FastQ file(s) to process. One or more FastQ files
+                        can be provided. The pipeline supports single-end and
+                        pair-end RNA-seq data.
+                          Example: --input .tests/*.R?.fastq.gz
+
+  --output OUTPUT
+                        Path to an output directory. This location is where
+                        the pipeline will create all of its output files, also
+                        known as the pipeline's working directory. If the user
+                        provided working directory has not been initialized,
+                        it will be created automatically.
+                          Example: --output /data/$USER/RNA_hg38
+
+  --genome {{hg38_36,mm10_M21,custom.json,...}}
+                        Reference genome. This option defines the reference
+                        genome of the samples. The default is hg38_36 if not specifies.
+                        RENEE on biowulf comes bundled with
+                        pre-built reference files for human and mouse samples;
+                        however, it is worth noting that the pipeline can accept
+                        custom reference genomes created with the build sub
+                        command. Run `renee --help` to view the current list of pre-built genomes.
+                        A custom reference genome created with
+                        the build sub command can also be provided. The name of
+                        this custom reference JSON file is dependent on the
+                        values provided to the following renee build args
+                        '--ref-name REF_NAME --gtf-ver GTF_VER', where the name
+                        of the output file uses the following naming convention:
+                        '{{REF_NAME}}_{{GTF_VER}}.json'.
+                          Example: --genome hg38_36
+
+{1}{2}Analysis options:{4}
+  --small-rna           Uses ENCODE's recommendations for small RNA. This
+                        option should be used with small RNA libraries. These
+                        are rRNA-depleted libraries that have been size
+                        selected to be shorter than 200bp. Size selection
+                        enriches for small RNA species such as miRNAs, siRNAs,
+                        or piRNAs. This option is only supported with single-
+                        end data. This option should not be combined with the
+                        star 2-pass basic option.
+                          Example: --small-rna
+
+  --star-2-pass-basic   Run STAR in per sample 2-pass mapping mode. It is
+                        recommended to use this option when processing a set
+                        of unrelated samples. It is not adivsed to use this
+                        option for a study with multiple related samples. By
+                        default, the pipeline ultilizes a multi sample 2-pass
+                        mapping approach where the set of splice junctions
+                        detected across all samples are provided to the second
+                        pass of STAR. This option overrides the default
+                        behavior so each sample will be processed in a per
+                        sample two-pass basic mode. This option should not be
+                        combined with the small RNA option.
+                          Example: --star-2-pass-basic
+
+{1}{2}Orchestration options:{4}
+  --dry-run             Does not execute anything. Only displays what steps in
+                        the pipeline remain or will be run.
+                          Example: --dry-run
+
+  --mode {{slurm,local}}
+                        Method of execution. Defines the mode of execution.
+                        Valid options for this mode include: local or slurm.
+                        Additional modes of execution are coming soon, default:
+                        slurm.
+                        Here is a brief description of each mode:
+                           • local: uses local method of execution. local runs
+                        will run serially on compute instance. This is useful
+                        for testing, debugging, or when a users does not have
+                        access to a  high  performance  computing environment.
+                        If this option is not provided, it will default to a
+                        slurm mode of execution.
+                           • slurm: uses slurm execution backend. This method
+                        will submit jobs to a  cluster  using sbatch. It is
+                        recommended running the pipeline in this mode as it
+                        will be significantly faster.
+                          Example: --mode slurm
+
+  --shared-resources SHARED_RESOURCES
+                        Local path to shared resources. The pipeline uses a set
+                        of shared reference files that can be re-used across ref-
+                        erence genomes. These currently include reference files
+                        for kraken and FQScreen. These reference files can be
+                        downloaded with the build sub command's --shared-resources
+                        option. These files only need to be downloaded once. If
+                        you are running the pipeline on Biowulf, you do NOT need
+                        to download these reference files! They already exist on
+                        the filesystem in a location that anyone can access. If
+                        you are running the pipeline on another cluster or target
+                        system, you will need to download the shared resources
+                        with the build sub command, and you will need to provide
+                        this option to the run sub command every time. Please
+                        provide the same path that was provided to the build sub
+                        command's --shared-resources option.
+                          Example: --shared-resources /data/shared/renee
+
+  --singularity-cache SINGULARITY_CACHE
+                        Overrides the $SINGULARITY_CACHEDIR variable. Images
+                        from remote registries are cached locally on the file
+                        system. By default, the singularity cache is set to:
+                        '/path/to/output/directory/.singularity/'. Please note
+                        that this cache cannot be shared across users.
+                          Example: --singularity-cache /data/$USER
+
+  --sif-cache SIF_CACHE
+                        Path where a local cache of SIFs are stored. This cache
+                        can be shared across users if permissions are properly
+                        setup. If a SIF does not exist in the SIF cache, the
+                        image will be pulled from Dockerhub. {0} cache
+                        sub command can be used to create a local SIF cache.
+                        Please see {0} cache for more information.
+                           Example: --sif-cache /data/$USER/sifs/
+
+  --wait
+                        Wait until master job completes. This is required if
+                        the job is submitted using HPC API. If not provided
+                        the API may interpret submission of master job as
+                        completion of the pipeline!
+
+  --create-nidap-folder
+                        Create folder called "NIDAP" with file to-be-moved back to NIDAP
+                        This makes it convenient to move only this folder (called NIDAP)
+                        and its content back to NIDAP, rather than the entire pipeline
+                        output folder.
+
+  --tmp-dir TMP_DIR
+                        Path on the file system for writing temporary output
+                        files. By default, the temporary directory is set to
+                        '/lscratch/$SLURM_JOBID' on NIH's Biowulf cluster and
+                        'OUTPUT' on the FRCE cluster.
+                        However, if you are running the pipeline on another cluster,
+                        this option will need to be specified.
+                        Ideally, this path should point to a dedicated location on
+                        the filesystem for writing tmp files.
+                        On many systems, this location is
+                        set to somewhere in /scratch. If you need to inject a
+                        variable into this string that should NOT be expanded,
+                        please quote this options value in single quotes.
+                          Example: --tmp-dir '/cluster_scratch/$USER/'
+  --threads THREADS
+                        Max number of threads for local processes. It is
+                        recommended setting this value to the maximum number
+                        of CPUs available on the host machine, default: 2.
+                          Example: --threads: 16
+
+{1}{2}Misc Options:{4}
+  -h, --help            Show usage information, help message, and exit.
+                          Example: --help
+"""
+
+_run_epilog = """
+{2}{3}Example:{4}
+  # Step 1.) Grab an interactive node,
+  # do not run on head node and add
+  # required dependencies to $PATH
+  srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
+  module purge
+  module load singularity snakemake
+
+  # Step 2A.) Dry run pipeline with provided test data
+  ./{0} run --input .tests/*.R?.fastq.gz \\
+                 --output /data/$USER/RNA_hg38 \\
+                 --genome hg38_36 \\
+                 --mode slurm \\
+                 --dry-run
+
+  # Step 2B.) Run RENEE pipeline
+  # The slurm mode will submit jobs to the cluster.
+  # It is recommended running renee in this mode.
+  ./{0} run --input .tests/*.R?.fastq.gz \\
+                 --output /data/$USER/RNA_hg38 \\
+                 --genome hg38_36 \\
+                 --mode slurm
+
+{2}{3}Ver:{4}
+  {1}
+
+{2}{3}Prebuilt genome+annotation combos:{4}
+  {5}
+"""
+
+_build_options_help = """
+{1}{0} {3}build{4}: {1}Builds reference files for the pipeline.{4}
+
+{1}{2}Synopsis:{4}
+  $ {0} build [--help] \\
+                        [--shared-resources SHARED_RESOURCES] [--small-genome] \\
+                        [--dry-run] [--singularity-cache SINGULARITY_CACHE] \\
+                        [--sif-cache SIF_CACHE] [--tmp-dir TMP_DIR] \\
+                        --ref-fa REF_FA \\
+                        --ref-name REF_NAME \\
+                        --ref-gtf REF_GTF \\
+                        --gtf-ver GTF_VER \\
+                        --wait \\
+                        --output OUTPUT
+
+{1}{2}Description:{4}
+  Builds the reference files for the RENEE pipeline from a genomic FASTA
+file and a GTF file. Disclaimer: If you have two GTF files, eg. hybrid genomes
+(viral + host), then you need to create one FASTA and one GTF file for the hybrid
+genome prior to running the renee build command. Reference files built with
+this sub command can be used with renee run sub command.
+
+  Optional arguments are shown in square brackets above. Please visit our docs
+at "https://CCBR.github.io/RENEE/" for more information, examples, and
+guides.
+
+{1}{2}Required arguments:{4}
+  --ref-fa REF_FA
+                      Genomic FASTA file of the reference genome. If you are
+                      downloading this from GENCODE, you should select the 'PRI'
+                      genomic FASTA file. This file will contain the primary
+                      genomic assembly (contains chromosomes and scaffolds).
+                        Example: --ref-fa GRCh38.primary_assembly.genome.fa
+  --ref-name REF_NAME
+                      Name of the input reference genome. This is the
+                      common name of the reference genome. Here is a list
+                      of common examples for different model organisms:
+                      mm10, hg38, rn6, danRer11, dm6, canFam3, sacCer3, ce11.
+                        Example: --ref-name GRCh38
+  --ref-gtf REF_GTF
+                      Annotation file or GTF file for the reference genome.
+                      If you are downloading this from GENCODE, you should select
+                      the 'PRI' GTF file. This file contains gene annotations for
+                      the primary assembly (contains chromosomes and scaffolds).
+                        Example: --ref-gtf gencode.v41.primary_assembly.gtf
+  --gtf-ver GTF_VER
+                      Version of the annotation file or GTF file provided.
+                      If you are using a GTF file from GENCODE, use the release
+                      number or version (i.e. 'M25' for mouse or '37' for human).
+                      Visit gencodegenes.org for more details.
+                        Example: --gtf-ver 41
+  --output OUTPUT
+                      Path to an output directory. This location is where the
+                      pipeline will create all of its output files. If the user
+                      provided working directory does not exist, it will be auto-
+                      matically created.
+                        Example: --output /data/$USER/refs/GRCh38_41
+
+{1}{2}Build options:{4}
+  --shared-resources SHARED_RESOURCES
+                      Path to download shared resources. The pipeline uses a
+                      set of shared reference files that can be re-used across
+                      reference genomes. These currently include reference files
+                      for kraken and FQScreen. With that being said, these files
+                      can be downloaded once in a shared or common location. If
+                      you are running the pipeline on Biowulf, you do NOT need
+                      to download these reference files. They already exist in
+                      an accessible location on the filesystem. If you're setting
+                      up the pipeline on a new cluster or target system, you will
+                      need to provide this option at least one time. The path
+                      provided to this option can be provided to the renee
+                      run sub command via the --shared-resources option.
+                        Example: --shared-resources /data/shared/renee
+
+  --small-genome      Builds a small genome index. For small genomes, it is
+                      recommended running STAR with --genomeSAindexNbases value
+                      scaled down. This option runs the build pipeline in a
+                      mode where it dynamically finds the optimal value based
+                      on the following: min(14, log2(GenomeSize)/2 - 1).
+                        Example: --small-genome
+
+{1}{2}Orchestration options:{4}
+  --dry-run           Does not execute anything. Only displays what steps in
+                      the pipeline remain or will be run.
+                        Example: --dry-run
+
+  --singularity-cache SINGULARITY_CACHE
+                      Overrides the $SINGULARITY_CACHEDIR variable. Images
+                      from remote registries are cached locally on the file
+                      system. By default, the singularity cache is set to:
+                      '/path/to/output/directory/.singularity/'. Please note
+                      that this cache cannot be shared across users.
+                        Example: --singularity-cache /data/$USER
+
+  --sif-cache SIF_CACHE
+                      Path where a local cache of SIFs are stored. This cache
+                      can be shared across users if permissions are properly
+                      setup. If a SIF does not exist in the SIF cache, the
+                      image will be pulled from Dockerhub. renee cache
+                      sub command can be used to create a local SIF cache.
+                      Please see renee cache for more information.
+                        Example: --sif-cache /data/$USER/sifs/
+
+  --tmp-dir TMP_DIR
+                    Path on the file system for writing temporary output
+                    files. By default, the temporary directory is set to
+                    '/lscratch/$SLURM_JOBID' on NIH's Biowulf cluster and
+                    'outdir' on the FRCE cluster.
+                    However, if you are running the pipeline on another cluster,
+                    this option will need to be specified.
+                    Ideally, this path should point to a dedicated location on
+                    the filesystem for writing tmp files.
+                    On many systems, this location is
+                    set to somewhere in /scratch. If you need to inject a
+                    variable into this string that should NOT be expanded,
+                    please quote this options value in single quotes.
+                        Example: --tmp-dir '/cluster_scratch/$USER/'
+
+  --wait
+                        Wait until master job completes. This is required if
+                        the job is submitted using HPC API. If not provided
+                        the API may interpret submission of master job as
+                        completion of the pipeline!
+
+{1}{2}Misc Options:{4}
+  -h, --help          Show usage information, help message, and exit.
+                        Example: --help
+"""
+
+_build_epilog = """
+{2}{3}Example:{4}
+  # Step 1.) Grab an interactive node,
+  # do not run on head node and add
+  # required dependencies to $PATH
+  srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
+  module purge
+  module load singularity snakemake
+
+  # Step 2B.) Dry-run the build pipeline
+  renee build --ref-fa GRCm39.primary_assembly.genome.fa \\
+                 --ref-name mm39 \\
+                 --ref-gtf gencode.vM26.annotation.gtf \\
+                 --gtf-ver M26 \\
+                 --output /data/$USER/refs/mm39_M26 \\
+                 --dry-run
+
+  # Step 2A.) Build {0} reference files
+  renee build --ref-fa GRCm39.primary_assembly.genome.fa \\
+                 --ref-name mm39 \\
+                 --ref-gtf gencode.vM26.annotation.gtf \\
+                 --gtf-ver M26 \\
+                 --output /data/$USER/refs/mm39_M26
+
+{2}{3}Version:{4}
+  {1}
+
+{2}{3}Prebuilt genome+annotation combos:{4}
+  {5}
+"""
+
+_unlock_options_help = """{1}{0} {3}unlock{4}: {1}Unlocks a previous output directory.{4}
+
+{1}{2}Synopsis:{4}
+  $ {0} unlock [--help] --output OUTPUT
+
+{1}{2}Description:{4}
+  If the pipeline fails ungracefully, it maybe required to unlock
+the working directory before proceeding again. Please verify that
+the pipeline is not running before running this command. If the
+pipeline is still running, the workflow manager will report the
+working directory is locked. This is normal behavior. Do NOT run
+this command if the pipeline is still running.
+
+  Optional arguments are shown in square brackets above. Please
+visit our docs at "https://CCBR.github.io/RENEE/" for more
+information, examples, and guides.
+
+{1}{2}Required arguments:{4}
+  --output OUTPUT       Path to a previous run's output directory
+                        to unlock. This will remove a lock on the
+                        working directory. Please verify that the
+                        pipeline is not running before running
+                        this command.
+                          Example: --output /data/$USER/output
+
+{1}{2}Misc Options:{4}
+  -h, --help            Show usage information and exit.
+                          Example: --help
+"""
+
+_unlock_epilog = """{2}{3}Example:{4}
+  # Step 1.) Grab an interactive node,
+  # do not run on head node and add
+  # required dependencies to $PATH
+  srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
+  module purge
+  module load singularity snakemake
+
+  # Step 2.) Unlock output directory of pipeline
+  {0} unlock --output /data/$USER/output
+
+{2}{3}Version:{4}
+  {1}
+"""
+
+_cache_options_help = """{1}{0} {3}cache{4}: {1}Cache software containers locally.{4}
+
+{1}{2}Synopsis:{4}
+  $ {0} cache [--help] [--dry-run] \\
+          --sif-cache SIF_CACHE
+
+{1}{2}Description:{4}
+Create a local cache of software dependencies hosted on DockerHub.
+These containers are normally pulled onto the filesystem when the
+pipeline runs; however, due to network issues or DockerHub pull
+rate limits, it may make sense to pull the resources once so a
+shared cache can be created. It is worth noting that a singularity
+cache cannot normally be shared across users. Singularity strictly
+enforces that a cache is owned by the user. To get around this
+issue, the cache subcommand can be used to create local SIFs on
+the filesystem from images on DockerHub.
+
+Optional arguments are shown in square brackets above. Please visit
+our docs at "https://CCBR.github.io/RENEE/" for more info,
+examples, and guides.
+
+{1}{2}Required arguments:{4}
+  --sif-cache SIF_CACHE
+                        Path where a local cache of SIFs will be
+                        stored. Images defined in containers.json
+                        will be pulled into the local filesystem.
+                        The path provided to this option can be
+                        passed to the --sif-cache option of the
+                        run sub command. Please see {0} run
+                        sub command for more information.
+                          Example: --sif-cache /data/$USER/cache
+
+{1}{2}Orchestration options:{4}
+  --dry-run             Does not execute anything. Only displays
+                        what remote resources would be pulled.
+                          Example: --dry-run
+
+{1}{2}Misc Options:{4}
+  -h, --help            Show usage information and exits.
+                          Example: --help
+"""
+
+_cache_epilog = """{2}Example:{4}
+  # Step 1.) Grab an interactive node,
+  # do not run on head node and add
+  # required dependencies to $PATH
+  srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
+  module purge
+  module load singularity snakemake
+
+  # Step 2A.) Dry-run cache to see
+  # what software containers will
+  # be pulled from Dockerhub
+  {0} cache --sif-cache /data/$USER/cache \\
+            --dry-run
+
+  # Step 2B.) Cache software containers
+  {0} cache --sif-cache /data/$USER/cache
+
+{2}Version:{4}
+  {1}
+"""
+
+
+def __getattr__(name):
+    # The version is only read from the VERSION file when it is requested
+    if name == "__version__":
+        return get_version()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+class VersionAction(argparse.Action):
+    """Argparse action that prints the version and exits. Unlike the builtin
+    'version' action, the version is only looked up when the option is used.
+    """
+
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help="show program's version number and exit",
+    ):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print("renee {}".format(get_version()))
+        parser.exit()
+
+
 class Colors:
     """Class encoding for ANSI escape sequences for styling terminal text.
     Any string that is formatting with these styles must be terminated with
-    the escape sequence, i.e. `Colors.end`.
+    the escape sequence, i.e. `Colors.end`. All styles are empty strings when
+    NO_COLOR is set or standard output is not a terminal.
     """
 
     # Escape sequence
@@ -83,6 +593,85 @@ class Colors:
     bg_white = "\33[47m"
 
 
+if "NO_COLOR" in os.environ or not sys.stdout.isatty():
+    for _style in [attr for attr in vars(Colors) if not attr.startswith("_")]:
+        setattr(Colors, _style, "")
+
+
+# Positional arguments shared by the help templates, they
+# are formatted as {0}: name, {1}: bold, {2}: url, {3}: italic, {4}: end
+_styles = ("renee", Colors.bold, Colors.url, Colors.italic, Colors.end)
+
+
+def _version_styles():
+    # Arguments of the epilog templates, {0}: name, {1}: version,
+    # {2}: bold, {3}: url, {4}: end, the version is read on first use
+    return ("renee", get_version(), Colors.bold, Colors.url, Colors.end)
+
+
+def exists(parser, filename):
+    """Checks that a file/directory exists without checking its permissions,
+    permission errors are left to the code that opens the file.
+    @param parser <argparse.ArgumentParser() object>:
+        Argparse parser object
+    @param filename <str>:
+        Name of file to check
+    @return filename <str>:
+        If file exists
+    """
+    if not os.path.exists(filename):
+        parser.error(
+            "File '{}' does not exists! Failed to provide valid input.".format(filename)
+        )
+
+    return filename
+
+
+def bulk_exists(parser, filenames):
+    """Checks that a list of files exist, without checking their permissions.
+    The parent directory of the files is listed once instead of checking each
+    file, i.e. for globbed FastQ files that share the same directory.
+    @param parser <argparse.ArgumentParser() object>:
+        Argparse parser object
+    @param filenames list[<str>]:
+        Names of files to check
+    @return filenames list[<str>]:
+        If all files exist
+    """
+    grouped = {}
+    for filename in filenames:
+        grouped.setdefault(os.path.dirname(filename), []).append(filename)
+
+    missing = []
+    for dirname, files in grouped.items():
+        try:
+            with os.scandir(dirname or ".") as entries:
+                # Broken symlinks do not exist
+                listed = {
+                    entry.name
+                    for entry in entries
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                }
+        except OSError:
+            listed = set()
+        # Anything not listed, i.e. a directory that cannot be read,
+        # falls back to checking the file on its own
+        missing.extend(
+            filename
+            for filename in files
+            if os.path.basename(filename) not in listed and not os.path.exists(filename)
+        )
+
+    if missing:
+        parser.error(
+            "File(s) '{}' do not exist! Failed to provide valid input.".format(
+                "', '".join(missing)
+            )
+        )
+
+    return filenames
+
+
 def permissions(parser, filename, *args, **kwargs):
     """Checks permissions using os.access() to see the user is authorized to access
     a file/directory. Checks for existence, readability, writability and executability via:
@@ -94,10 +683,7 @@ def permissions(parser, filename, *args, **kwargs):
     @return filename <str>:
         If file exists and user can read from file
     """
-    if not os.path.exists(filename):
-        parser.error(
-            "File '{}' does not exists! Failed to provide valid input.".format(filename)
-        )
+    exists(parser, filename)
 
     if not os.access(filename, *args, **kwargs):
         parser.error(
@@ -120,10 +706,13 @@ def check_cache(parser, cache, *args, **kwargs):
     @return cache <str>:
         If singularity cache dir is valid
     """
-    if not os.path.exists(cache):
+    try:
+        mode = os.stat(cache).st_mode
+    except FileNotFoundError:
         # Cache directory does not exist on filesystem
-        os.makedirs(cache)
-    elif os.path.isfile(cache):
+        os.makedirs(cache, exist_ok=True)
+        mode = None
+    if mode is not None and stat.S_ISREG(mode):
         # Cache directory exists as file, raise error
         parser.error(
             """\n\t\x1b[6;37;41mFatal: Failed to provided a valid singularity cache!\x1b[0m
@@ -133,14 +722,15 @@ def check_cache(parser, cache, *args, **kwargs):
                 sys.argv[0]
             )
         )
-    elif os.path.isdir(cache):
+    elif mode is not None and stat.S_ISDIR(mode):
         # Provide cache exists as directory
         # Check that the user owns the child cache directory
         # May revert to os.getuid() if user id is not sufficient
-        if (
-            os.path.exists(os.path.join(cache, "cache"))
-            and os.stat(os.path.join(cache, "cache")).st_uid != os.getuid()
-        ):
+        try:
+            owner = os.stat(os.path.join(cache, "cache")).st_uid
+        except FileNotFoundError:
+            owner = None
+        if owner is not None and owner != os.getuid():
             # User does NOT own the cache directory, raise error
             parser.error(
                 """\n\t\x1b[6;37;41mFatal: Failed to provided a valid singularity cache!\x1b[0m
@@ -167,7 +757,39 @@ def unlock(sub_args):
     outdir = sub_args.output
 
     try:
-        unlock_output = subprocess.check_output(
+        import snakemake
+    except ImportError:
+        # Snakemake is not importable from this interpreter,
+        # fall back to the snakemake found in $PATH
+        _unlock_subprocess(outdir)
+    else:
+        # Unlock in-process to skip starting another interpreter
+        outdir = os.path.abspath(outdir)
+        unlocked = snakemake.snakemake(
+            os.path.join(outdir, "workflow", "Snakefile"),
+            configfiles=[os.path.join(outdir, "config.json")],
+            workdir=outdir,
+            cores=1,
+            unlock=True,
+        )
+        if not unlocked:
+            sys.exit(
+                "Failed to unlock the pipeline's working directory: {}".format(outdir)
+            )
+
+    print("Successfully unlocked the pipeline's working directory!")
+
+
+def _unlock_subprocess(outdir):
+    """Private function for unlock() that unlocks the output directory with
+    the snakemake command-line interface.
+    @param outdir <str>:
+        Pipeline output directory to unlock
+    """
+    import subprocess
+
+    try:
+        subprocess.check_output(
             ["snakemake", "--unlock", "--cores", "1", "--configfile=config.json"],
             cwd=outdir,
             stderr=subprocess.STDOUT,
@@ -178,8 +800,6 @@ def unlock(sub_args):
         # Unlocking process returned a non-zero exit code
         sys.exit("{}\n{}".format(e, e.output))
 
-    print("Successfully unlocked the pipeline's working directory!")
-
 
 def _sym_refs(input_data, target, make_copy=False):
     """Creates symlinks for each reference file provided
@@ -200,21 +820,32 @@ def _sym_refs(input_data, target, make_copy=False):
     """
     # Find canocial paths of input files for adding to singularity bindpaths
     canocial_input_paths = []
-    for file in input_data:
-        target_name = os.path.join(os.path.abspath(target), os.path.basename(file))
-        source_name = os.path.abspath(os.path.realpath(file))
-        canocial_input_paths.append(os.path.dirname(source_name))
+    # Open the target once so each link or copy is resolved relative to it
+    target = os.path.abspath(target)
+    target_fd = os.open(target, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for file in input_data:
+            basename = os.path.basename(file)
+            source_name = realpath(file)
+            canocial_input_paths.append(os.path.dirname(source_name))
 
-        if not os.path.exists(target_name):
             if not make_copy:
                 # Create a symlink if it does not already exist
                 # Follow source symlinks to resolve any binding issues
-                os.symlink(source_name, target_name)
+                try:
+                    os.symlink(source_name, basename, dir_fd=target_fd)
+                except FileExistsError:
+                    pass
             else:
                 # Create a physical copy if it does not already exist
-                copy(file, os.path.abspath(target))
+                try:
+                    os.stat(basename, dir_fd=target_fd, follow_symlinks=False)
+                except FileNotFoundError:
+                    copy(file, target)
+    finally:
+        os.close(target_fd)
 
-    return list(set(canocial_input_paths))
+    return list(dict.fromkeys(canocial_input_paths))
 
 
 def _configure(sub_args, filename, git_repo):
@@ -232,41 +863,51 @@ def _configure(sub_args, filename, git_repo):
     # Resolves if an image needs to be pulled from an OCI registry or
     # a local SIF generated from the renee cache subcommand exists
     sif_config = image_cache(sub_args, {})
-    # Creates config file /path/to/output/config/build.yml
+    # Builds config file /path/to/output/config/build.yml
+    # in memory and writes it out in one go
+    ref_fa = os.path.join(sub_args.output, os.path.basename(sub_args.ref_fa))
+    ref_gtf = os.path.join(sub_args.output, os.path.basename(sub_args.ref_gtf))
+    lines = [
+        f'GENOME: "{sub_args.ref_name}"',
+        f'REFFA: "{ref_fa}"',
+        f'GTFFILE: "{ref_gtf}"',
+        f'GTFVER: "{sub_args.gtf_ver}"',
+        f'OUTDIR: "{sub_args.output}"',
+        f'SCRIPTSDIR: "{sub_args.output}/workflow/scripts/builder"',
+        f'BUILD_HOME: "{git_repo}"',
+        f'SMALL_GENOME: "{sub_args.small_genome}"',
+        f'TMP_DIR: "{sub_args.tmp_dir}"',
+        f'SHARED_RESOURCES: "{sub_args.shared_resources}"',
+    ]
+    # Add singularity images URIs or local SIFs
+    # Converts a nested json file to yaml format
+    for k, images in sif_config.items():
+        lines.append(f"{k}: ")
+        lines.extend(f'  {tag}: "{uri}"' for tag, uri in images.items())
     with open(filename, "w") as fh:
-        fh.write('GENOME: "{}"\n'.format(sub_args.ref_name))
-        fh.write(
-            'REFFA: "{}"\n'.format(
-                os.path.join(sub_args.output, os.path.basename(sub_args.ref_fa))
-            )
-        )
-        fh.write(
-            'GTFFILE: "{}"\n'.format(
-                os.path.join(sub_args.output, os.path.basename(sub_args.ref_gtf))
-            )
-        )
-        fh.write('GTFVER: "{}"\n'.format(sub_args.gtf_ver))
-        fh.write('OUTDIR: "{}"\n'.format(sub_args.output))
-        fh.write('SCRIPTSDIR: "{}/workflow/scripts/builder"\n'.format(sub_args.output))
-        fh.write('BUILD_HOME: "{}"\n'.format(git_repo))
-        fh.write('SMALL_GENOME: "{}"\n'.format(sub_args.small_genome))
-        fh.write('TMP_DIR: "{}"\n'.format(sub_args.tmp_dir))
-        fh.write('SHARED_RESOURCES: "{}"\n'.format(sub_args.shared_resources))
-        # fh.write('READLENGTHS:\n')
-        # read_lengths = ['50', '75', '100', '125', '150']
-        # for rl in read_lengths:
-        #     fh.write('  - {}\n'.format(rl))
-        # Add singularity images URIs or local SIFs
-        # Converts a nested json file to yaml format
-        for k in sif_config.keys():
-            fh.write("{}: \n".format(k))
-            for tag, uri in sif_config[k].items():
-                fh.write('  {}: "{}"\n'.format(tag, uri))
+        fh.write("\n".join(lines) + "\n")
     print("Done!")
 
 
 def _reset_write_permission(target):
-    os.system("chmod -R u+w,g-w,o-w " + target)
+    """Recursively adds write permission for the user and removes it for the
+    group and others, equivalent to `chmod -R u+w,g-w,o-w target`. Symlinks
+    are left untouched.
+    @param target <str>:
+        Path to the directory to update
+    """
+    _set_write_permission(target)
+    for root, dirs, files in os.walk(target):
+        for name in dirs + files:
+            _set_write_permission(os.path.join(root, name))
+
+
+def _set_write_permission(path):
+    mode = os.lstat(path).st_mode
+    if not stat.S_ISLNK(mode):
+        os.chmod(
+            path, (stat.S_IMODE(mode) | stat.S_IWUSR) & ~(stat.S_IWGRP | stat.S_IWOTH)
+        )
 
 
 def configure_build(sub_args, git_repo, output_path):
@@ -280,11 +921,14 @@ def configure_build(sub_args, git_repo, output_path):
     @return additional_bind_paths list[<str>]:
         List of canonical paths for the list of input files to be added singularity bindpath
     """
-    if not os.path.exists(output_path):
+    try:
+        is_file = stat.S_ISREG(os.stat(output_path).st_mode)
+    except FileNotFoundError:
         # Pipeline output directory does not exist on filesystem
-        os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
+        is_file = False
 
-    elif os.path.exists(output_path) and os.path.isfile(output_path):
+    if is_file:
         # Provided Path for pipeline output directory exists as file
         raise OSError(
             """\n\tFatal: Failed to create provided pipeline output directory!
@@ -343,8 +987,6 @@ def build(sub_args):
         if not sub_args.shared_resources in additional_bind_paths:
             additional_bind_paths.append(sub_args.shared_resources)
 
-    additional_bind_paths = ",".join(additional_bind_paths)
-
     # determine "wait"
     wait = ""
     if sub_args.wait:
@@ -355,20 +997,20 @@ def build(sub_args):
 
     # Dryrun pipeline
     if sub_args.dry_run:
-        dryrun_output = dryrun(
+        from .dryrun import dryrun
+
+        # the output of the dryrun is streamed to stdout
+        print("\nDry-running RENEE Reference building pipeline:")
+        dryrun(
             outdir=output_path,
             config=os.path.join("config", "build.yml"),
             snakefile=os.path.join("workflow", "rules", "build.smk"),
         )
-
-        print(
-            "\nDry-running RENEE Reference building pipeline:\n{}".format(
-                dryrun_output.decode("utf-8")
-            )
-        )
         sys.exit(0)
 
     # Run RENEE reference building pipeline
+    from .orchestrate import orchestrate
+
     masterjob = orchestrate(
         mode="slurm",
         outdir=output_path,
@@ -376,7 +1018,7 @@ def build(sub_args):
         alt_cache=sub_args.singularity_cache,
         submission_script="builder",
         masterjob="pl:build",
-        tmp_dir=get_tmp_dir(sub_args.tmp_dir, sub_args.output),
+        tmp_dir=get_tmp_dir(sub_args.tmp_dir, sub_args.output, hpc=hpcname),
         wait=wait,
         hpcname=hpcname,
     )
@@ -384,29 +1026,16 @@ def build(sub_args):
     masterjob.wait()
 
     # Relay information about submission
-    # of the master job or the exit code of the
-    # pipeline that ran in local mode
-    sub_args.mode = "slurm"
-    if sub_args.mode == "local":
-        if int(masterjob.returncode) == 0:
-            print("{} pipeline has successfully completed".format("RENEE"))
-        else:
-            fatal(
-                "{} pipeline failed. Please see standard output for more information.".format(
-                    "RENEE"
-                )
-            )
-    elif sub_args.mode == "slurm":
-        with open(
-            os.path.join(sub_args.output, "logfiles", "bjobid.log"), "r"
-        ) as infile:
-            jobid = infile.read().strip()
-
-        if int(masterjob.returncode) == 0:
-            print("Successfully submitted master job: ", end="")
-        else:
-            fatal("Error occurred when submitting the master job.")
-        print(jobid)
+    # of the master job, reference builds
+    # are always submitted in slurm mode
+    with open(os.path.join(sub_args.output, "logfiles", "bjobid.log"), "r") as infile:
+        jobid = infile.read().strip()
+
+    if int(masterjob.returncode) == 0:
+        print("Successfully submitted master job: ", end="")
+    else:
+        fatal("Error occurred when submitting the master job.")
+    print(jobid)
 
 
 def cache(sub_args):
@@ -416,15 +1045,21 @@ def cache(sub_args):
     @param sub_args <parser.parse_args() object>:
         Parsed arguments for unlock sub-command
     """
+    import subprocess
+
     sif_cache = sub_args.sif_cache
     # Get absolute PATH to templates in renee git repo
     images = os.path.join(RENEE_PATH, "config", "containers", "images.json")
 
     # Create image cache
-    if not os.path.exists(sif_cache):
+    try:
+        is_file = stat.S_ISREG(os.stat(sif_cache).st_mode)
+    except FileNotFoundError:
         # Pipeline output directory does not exist on filesystem
-        os.makedirs(sif_cache)
-    elif os.path.exists(sif_cache) and os.path.isfile(sif_cache):
+        os.makedirs(sif_cache, exist_ok=True)
+        is_file = False
+
+    if is_file:
         # Provided Path for pipeline output directory exists as file
         raise OSError(
             """\n\tFatal: Failed to create provided sif cache directory!
@@ -436,18 +1071,18 @@ def cache(sub_args):
         )
 
     # Check if local SIFs already exist on the filesystem
-    with open(images, "r") as fh:
-        data = json.load(fh)
+    container_images = _load_images(images, os.stat(images).st_mtime_ns)
+
+    with os.scandir(sif_cache) as entries:
+        cached_sifs = {entry.name for entry in entries}
 
     pull = []
-    for image, uri in data["images"].items():
-        sif = os.path.join(
-            sif_cache, "{}.sif".format(os.path.basename(uri).replace(":", "_"))
-        )
-        if not os.path.exists(sif):
+    for uri in container_images.values():
+        sif = f"{os.path.basename(uri).replace(':', '_')}.sif"
+        if sif not in cached_sifs:
             # If local sif does not exist on in cache, print warning
             # and default to pulling from URI in config/containers/images.json
-            print('Image will be pulled from "{}".'.format(uri), file=sys.stderr)
+            print(f'Image will be pulled from "{uri}".', file=sys.stderr)
             pull.append(uri)
 
     if not pull:
@@ -457,17 +1092,27 @@ def cache(sub_args):
         # There are image(s) that need to be pulled
         if not sub_args.dry_run:
             # submission_script for renee cache is /path/to/output/resources/cacher
-            # Quote user provided values to avoid shell injections
-            username = os.environ.get("USER", os.environ.get("USERNAME"))
+            # Pass arguments as a list, no shell is involved in the submission
             masterjob = subprocess.Popen(
-                "sbatch --parsable -J pl:cache --time=10:00:00 --mail-type=BEGIN,END,FAIL "
-                + str(os.path.join(RENEE_PATH, "resources", "cacher"))
-                + " slurm "
-                + " -s '{}' ".format(sif_cache)
-                + " -i '{}' ".format(",".join(pull))
-                + " -t '{0}/{1}/.singularity/' ".format(sif_cache, username),
+                [
+                    "sbatch",
+                    "--parsable",
+                    "-J",
+                    "pl:cache",
+                    "--time=10:00:00",
+                    "--mail-type=BEGIN,END,FAIL",
+                    os.path.join(RENEE_PATH, "resources", "cacher"),
+                    "slurm",
+                    "-s",
+                    sif_cache,
+                    "-i",
+                    ",".join(pull),
+                    "-t",
+                    "{0}/{1}/.singularity/".format(sif_cache, _username()),
+                ],
                 cwd=sif_cache,
-                shell=True,
+                # Nothing sensitive is open, skip closing inherited fds
+                close_fds=False,
                 stderr=subprocess.STDOUT,
                 stdout=subprocess.PIPE,
             )
@@ -480,6 +1125,58 @@ def cache(sub_args):
             )
 
 
+@functools.lru_cache(maxsize=1)
+def _username():
+    """Private function that returns the name of the user running the pipeline,
+    it does not change for the lifetime of the process.
+    @return username <str>
+    """
+    username = os.environ.get("USER") or os.environ.get("USERNAME")
+    if not username:
+        import pwd
+
+        username = pwd.getpwuid(os.getuid()).pw_name
+    return username
+
+
+@functools.lru_cache(maxsize=4)
+def _load_images(images, mtime):
+    """Private function for cache() that parses the images of a containers
+    JSON file, i.e. config/containers/images.json.
+    @param images <str>:
+        Path to the containers JSON file
+    @param mtime <int>:
+        Modification time of the file in ns, a new mtime forces a re-parse
+    @return images <dict>:
+        Image names mapped to their URIs
+    """
+    import json
+
+    with open(images, "rb") as fh:
+        return json.loads(fh.read())["images"]
+
+
+def _abspath(option):
+    """Argparse type for paths, expands the user's home directory and returns
+    the absolute path of the provided option.
+    @param option <str>:
+        User provided path
+    @return path <str>:
+        Absolute path
+    """
+    return os.path.abspath(os.path.expanduser(option))
+
+
+def _readable_abspath(parser, option):
+    # Absolute path of an option the user must be able to read
+    return permissions(parser, _abspath(option), os.R_OK)
+
+
+def _cache_abspath(parser, option):
+    # Absolute path of a valid singularity cache directory
+    return check_cache(parser, _abspath(option))
+
+
 def genome_options(parser, user_option, prebuilt):
     """Dynamically checks if --genome option is a valid choice. Compares against a
     list of prebuilt or bundled genome reference genomes and accepts a custom reference
@@ -519,34 +1216,17 @@ def genome_options(parser, user_option, prebuilt):
     return user_option
 
 
-def parsed_arguments(name, description):
-    """Parses user-provided command-line arguments. Requires argparse and textwrap
-    package. argparse was added to standard lib in python 3.2 and textwrap was added
-    in python 3.5. To create custom help formatting for subparsers a docstring is
-    used create the help message for required options. argparse does not support named
-    subparser groups, which is normally what would be used to accomphish this reformatting.
-    As so, the help message for require options must be suppressed. If a new required arg
-    is added to a subparser, it must be added to the docstring and the usage statement
-    also must be updated.
-    @param name <str>:
-        Name of the pipeline or command-line tool
-    @param description <str>:
-        Short description of pipeline or command-line tool
+def _add_run_parser(parser, subparsers, help_message):
+    """Adds the "run" sub-command to the top-level parser.
+    @param parser <argparse.ArgumentParser() object>:
+        Top-level parser, used to report invalid arguments
+    @param subparsers <argparse._SubParsersAction object>:
+        Sub-command parsers of the top-level parser
+    @param help_message <str>:
+        Short help message listed in the top-level usage
     """
-    # Add styled name and description
-    c = Colors
-    styled_name = "{0}RENEE{1}".format(c.bold, c.end)
-    description = "{0}{1}{2}".format(c.bold, description, c.end)
-
-    # Create a top-level parser
-    parser = argparse.ArgumentParser(prog="renee", description=description)
-
-    # Adding Version information
-    parser.add_argument(
-        "--version", action="version", version="renee {}".format(__version__)
-    )
-    # Create sub-command parser
-    subparsers = parser.add_subparsers(help="List of available sub-commands")
+    # Prebuilt genome+annotation combos are listed once
+    genomes = get_genomes_list()
 
     # Options for the "run" sub-command
     # Grouped sub-parser arguments are currently not supported by argparse.
@@ -554,233 +1234,18 @@ def parsed_arguments(name, description):
     # Here is a work around to create more useful help message for named
     # options that are required! Please note: if a required arg is added the
     # description below should be updated (i.e. update usage and add new option)
-    required_run_options = textwrap.dedent(
-        """
-        {1}{0} {3}run{4}: {1} Runs the data-processing and quality-control pipeline.{4}
-
-        {1}{2}Synopsis:{4}
-          $ {0} run [--help] \\
-                              [--small-rna] [--star-2-pass-basic] \\
-                              [--dry-run] [--mode {{slurm, local}}] \\
-                              [--shared-resources SHARED_RESOURCES] \\
-                              [--singularity-cache SINGULARITY_CACHE] \\
-                              [--sif-cache SIF_CACHE] \\
-                              [--tmp-dir TMP_DIR] \\
-                              [--wait] \\
-                              [--create-nidap-folder] \\
-                              [--threads THREADS] \\
-                              --input INPUT [INPUT ...] \\
-                              --output OUTPUT \\
-                              --genome {{hg38_36, mm10_M21, custom.json, ...}}
-
-        {1}{2}Description:{4}
-          To run the pipeline with with your data, please provide a space separated
-        list of FastQs (globbing is supported), an output directory to store results,
-        and a reference genome.
-
-          Optional arguments are shown in square brackets above. Please visit our docs
-        at "https://CCBR.github.io/RENEE/" for more information, examples, and
-        guides.
-
-        {1}{2}Required arguments:{4}
-          --input INPUT [INPUT ...]
-                                Input FastQ file(s) to process. One or more FastQ files
-                                can be provided. The pipeline supports single-end and
-                                pair-end RNA-seq data.
-                                  Example: --input .tests/*.R?.fastq.gz
-
-          --output OUTPUT
-                                Path to an output directory. This location is where
-                                the pipeline will create all of its output files, also
-                                known as the pipeline's working directory. If the user
-                                provided working directory has not been initialized,
-                                it will be created automatically.
-                                  Example: --output /data/$USER/RNA_hg38
-
-          --genome {{hg38_36,mm10_M21,custom.json,...}}
-                                Reference genome. This option defines the reference
-                                genome of the samples. The default is hg38_36 if not specifies.
-                                RENEE on biowulf comes bundled with
-                                pre-built reference files for human and mouse samples;
-                                however, it is worth noting that the pipeline can accept
-                                custom reference genomes created with the build sub
-                                command. Run `renee --help` to view the current list of pre-built genomes.
-                                A custom reference genome created with
-                                the build sub command can also be provided. The name of
-                                this custom reference JSON file is dependent on the
-                                values provided to the following renee build args
-                                '--ref-name REF_NAME --gtf-ver GTF_VER', where the name
-                                of the output file uses the following naming convention:
-                                '{{REF_NAME}}_{{GTF_VER}}.json'.
-                                  Example: --genome hg38_36
-
-        {1}{2}Analysis options:{4}
-          --small-rna           Uses ENCODE's recommendations for small RNA. This
-                                option should be used with small RNA libraries. These
-                                are rRNA-depleted libraries that have been size
-                                selected to be shorter than 200bp. Size selection
-                                enriches for small RNA species such as miRNAs, siRNAs,
-                                or piRNAs. This option is only supported with single-
-                                end data. This option should not be combined with the
-                                star 2-pass basic option.
-                                  Example: --small-rna
-
-          --star-2-pass-basic   Run STAR in per sample 2-pass mapping mode. It is
-                                recommended to use this option when processing a set
-                                of unrelated samples. It is not adivsed to use this
-                                option for a study with multiple related samples. By
-                                default, the pipeline ultilizes a multi sample 2-pass
-                                mapping approach where the set of splice junctions
-                                detected across all samples are provided to the second
-                                pass of STAR. This option overrides the default
-                                behavior so each sample will be processed in a per
-                                sample two-pass basic mode. This option should not be
-                                combined with the small RNA option.
-                                  Example: --star-2-pass-basic
-
-        {1}{2}Orchestration options:{4}
-          --dry-run             Does not execute anything. Only displays what steps in
-                                the pipeline remain or will be run.
-                                  Example: --dry-run
-
-          --mode {{slurm,local}}
-                                Method of execution. Defines the mode of execution.
-                                Valid options for this mode include: local or slurm.
-                                Additional modes of execution are coming soon, default:
-                                slurm.
-                                Here is a brief description of each mode:
-                                   • local: uses local method of execution. local runs
-                                will run serially on compute instance. This is useful
-                                for testing, debugging, or when a users does not have
-                                access to a  high  performance  computing environment.
-                                If this option is not provided, it will default to a
-                                slurm mode of execution.
-                                   • slurm: uses slurm execution backend. This method
-                                will submit jobs to a  cluster  using sbatch. It is
-                                recommended running the pipeline in this mode as it
-                                will be significantly faster.
-                                  Example: --mode slurm
-
-          --shared-resources SHARED_RESOURCES
-                                Local path to shared resources. The pipeline uses a set
-                                of shared reference files that can be re-used across ref-
-                                erence genomes. These currently include reference files
-                                for kraken and FQScreen. These reference files can be
-                                downloaded with the build sub command's --shared-resources
-                                option. These files only need to be downloaded once. If
-                                you are running the pipeline on Biowulf, you do NOT need
-                                to download these reference files! They already exist on
-                                the filesystem in a location that anyone can access. If
-                                you are running the pipeline on another cluster or target
-                                system, you will need to download the shared resources
-                                with the build sub command, and you will need to provide
-                                this option to the run sub command every time. Please
-                                provide the same path that was provided to the build sub
-                                command's --shared-resources option.
-                                  Example: --shared-resources /data/shared/renee
-
-          --singularity-cache SINGULARITY_CACHE
-                                Overrides the $SINGULARITY_CACHEDIR variable. Images
-                                from remote registries are cached locally on the file
-                                system. By default, the singularity cache is set to:
-                                '/path/to/output/directory/.singularity/'. Please note
-                                that this cache cannot be shared across users.
-                                  Example: --singularity-cache /data/$USER
+    # Help text is only rendered when it is requested
+    required_run_options = run_epilog = None
+    if _help_requested():
+        required_run_options = _run_options_help.format(*_styles)
 
-          --sif-cache SIF_CACHE
-                                Path where a local cache of SIFs are stored. This cache
-                                can be shared across users if permissions are properly
-                                setup. If a SIF does not exist in the SIF cache, the
-                                image will be pulled from Dockerhub. {0} cache
-                                sub command can be used to create a local SIF cache.
-                                Please see {0} cache for more information.
-                                   Example: --sif-cache /data/$USER/sifs/
-
-          --wait
-                                Wait until master job completes. This is required if
-                                the job is submitted using HPC API. If not provided
-                                the API may interpret submission of master job as
-                                completion of the pipeline!
-
-          --create-nidap-folder
-                                Create folder called "NIDAP" with file to-be-moved back to NIDAP
-                                This makes it convenient to move only this folder (called NIDAP)
-                                and its content back to NIDAP, rather than the entire pipeline
-                                output folder.
-
-          --tmp-dir TMP_DIR
-                                Path on the file system for writing temporary output
-                                files. By default, the temporary directory is set to
-                                '/lscratch/$SLURM_JOBID' on NIH's Biowulf cluster and
-                                'OUTPUT' on the FRCE cluster.
-                                However, if you are running the pipeline on another cluster,
-                                this option will need to be specified.
-                                Ideally, this path should point to a dedicated location on
-                                the filesystem for writing tmp files.
-                                On many systems, this location is
-                                set to somewhere in /scratch. If you need to inject a
-                                variable into this string that should NOT be expanded,
-                                please quote this options value in single quotes.
-                                  Example: --tmp-dir '/cluster_scratch/$USER/'
-          --threads THREADS
-                                Max number of threads for local processes. It is
-                                recommended setting this value to the maximum number
-                                of CPUs available on the host machine, default: 2.
-                                  Example: --threads: 16
-
-        {1}{2}Misc Options:{4}
-          -h, --help            Show usage information, help message, and exit.
-                                  Example: --help
-        """.format(
-            "renee", c.bold, c.url, c.italic, c.end
-        )
-    )
-
-    # Display example usage in epilog
-    run_epilog = textwrap.dedent(
-        """
-        {2}{3}Example:{4}
-          # Step 1.) Grab an interactive node,
-          # do not run on head node and add
-          # required dependencies to $PATH
-          srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
-          module purge
-          module load singularity snakemake
-
-          # Step 2A.) Dry run pipeline with provided test data
-          ./{0} run --input .tests/*.R?.fastq.gz \\
-                         --output /data/$USER/RNA_hg38 \\
-                         --genome hg38_36 \\
-                         --mode slurm \\
-                         --dry-run
-
-          # Step 2B.) Run RENEE pipeline
-          # The slurm mode will submit jobs to the cluster.
-          # It is recommended running renee in this mode.
-          ./{0} run --input .tests/*.R?.fastq.gz \\
-                         --output /data/$USER/RNA_hg38 \\
-                         --genome hg38_36 \\
-                         --mode slurm
-
-        {2}{3}Ver:{4}
-          {1}
-
-        {2}{3}Prebuilt genome+annotation combos:{4}
-          {5}
-        """.format(
-            "renee",
-            __version__,
-            c.bold,
-            c.url,
-            c.end,
-            list(get_genomes_list(repo_base=renee_base)),
-        )
-    )
+        # Display example usage in epilog
+        run_epilog = _run_epilog.format(*_version_styles(), genomes)
 
     # Suppressing help message of required args to overcome no sub-parser named groups
     subparser_run = subparsers.add_parser(
         "run",
-        help="Run the RENEE pipeline with your FastQ files.",
+        help=help_message,
         usage=argparse.SUPPRESS,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         description=required_run_options,
@@ -788,18 +1253,13 @@ def parsed_arguments(name, description):
         add_help=False,
     )
 
-    subparser_gui = subparsers.add_parser(
-        "gui",
-        help="Launch the RENEE pipeline with a Graphical User Interface (GUI)",
-        description="",
-    )
-
     # Required Arguments
     # Input FastQ files
     subparser_run.add_argument(
         "--input",
-        # Check if the file exists and if it is readable
-        type=lambda file: permissions(parser, file, os.R_OK),
+        # Existence of the files is checked once
+        # all of them are parsed, see parsed_arguments()
+        type=str,
         required=True,
         nargs="+",
         help=argparse.SUPPRESS,
@@ -809,7 +1269,7 @@ def parsed_arguments(name, description):
     # analysis working directory
     subparser_run.add_argument(
         "--output",
-        type=lambda option: os.path.abspath(os.path.expanduser(option)),
+        type=_abspath,
         required=True,
         help=argparse.SUPPRESS,
     )
@@ -820,11 +1280,7 @@ def parsed_arguments(name, description):
         "--genome",
         required=False,
         default="hg38_36",
-        type=lambda option: str(
-            genome_options(
-                subparser_run, option, get_genomes_list(repo_base=renee_base)
-            )
-        ),
+        type=functools.partial(genome_options, subparser_run, prebuilt=genomes),
         help=argparse.SUPPRESS,
     )
 
@@ -890,9 +1346,7 @@ def parsed_arguments(name, description):
     # more information
     subparser_run.add_argument(
         "--shared-resources",
-        type=lambda option: permissions(
-            parser, os.path.abspath(os.path.expanduser(option)), os.R_OK
-        ),
+        type=functools.partial(_readable_abspath, parser),
         required=False,
         default=None,
         help=argparse.SUPPRESS,
@@ -902,9 +1356,7 @@ def parsed_arguments(name, description):
     # default uses output directory
     subparser_run.add_argument(
         "--singularity-cache",
-        type=lambda option: check_cache(
-            parser, os.path.abspath(os.path.expanduser(option))
-        ),
+        type=functools.partial(_cache_abspath, parser),
         required=False,
         help=argparse.SUPPRESS,
     )
@@ -913,10 +1365,11 @@ def parsed_arguments(name, description):
     # default pulls from Dockerhub
     subparser_run.add_argument(
         "--sif-cache",
-        type=lambda option: os.path.abspath(os.path.expanduser(option)),
+        type=_abspath,
         required=False,
         help=argparse.SUPPRESS,
-        default=get_sif_cache_dir(hpc=get_hpcname()),
+        # Resolved on use when the option is not provided, see _run()
+        default=None,
     )
 
     # Create NIDAP output folder
@@ -961,190 +1414,56 @@ def parsed_arguments(name, description):
         "--threads", type=int, required=False, default=2, help=argparse.SUPPRESS
     )
 
+    subparser_run.set_defaults(func=_run)
+
+
+def _add_gui_parser(parser, subparsers, help_message):
+    """Adds the "gui" sub-command to the top-level parser.
+    @param parser <argparse.ArgumentParser() object>:
+        Top-level parser, used to report invalid arguments
+    @param subparsers <argparse._SubParsersAction object>:
+        Sub-command parsers of the top-level parser
+    @param help_message <str>:
+        Short help message listed in the top-level usage
+    """
+    subparser_gui = subparsers.add_parser(
+        "gui",
+        help=help_message,
+        description="",
+    )
+    subparser_gui.set_defaults(func=_launch_gui)
+
+
+def _add_build_parser(parser, subparsers, help_message):
+    """Adds the "build" sub-command to the top-level parser.
+    @param parser <argparse.ArgumentParser() object>:
+        Top-level parser, used to report invalid arguments
+    @param subparsers <argparse._SubParsersAction object>:
+        Sub-command parsers of the top-level parser
+    @param help_message <str>:
+        Short help message listed in the top-level usage
+    """
     # Options for the "build" sub-command
     # Grouped sub-parser arguments are currently not supported.
     # https://bugs.python.org/issue9341
     # Here is a work around to create more useful help message for named
     # options that are required! Please note: if a required arg is added the
     # description below should be updated (i.e. update usage and add new option)
-    required_build_options = textwrap.dedent(
-        """
-        {1}{0} {3}build{4}: {1}Builds reference files for the pipeline.{4}
-
-        {1}{2}Synopsis:{4}
-          $ {0} build [--help] \\
-                                [--shared-resources SHARED_RESOURCES] [--small-genome] \\
-                                [--dry-run] [--singularity-cache SINGULARITY_CACHE] \\
-                                [--sif-cache SIF_CACHE] [--tmp-dir TMP_DIR] \\
-                                --ref-fa REF_FA \\
-                                --ref-name REF_NAME \\
-                                --ref-gtf REF_GTF \\
-                                --gtf-ver GTF_VER \\
-                                --wait \\
-                                --output OUTPUT
-
-        {1}{2}Description:{4}
-          Builds the reference files for the RENEE pipeline from a genomic FASTA
-        file and a GTF file. Disclaimer: If you have two GTF files, eg. hybrid genomes
-        (viral + host), then you need to create one FASTA and one GTF file for the hybrid
-        genome prior to running the renee build command. Reference files built with
-        this sub command can be used with renee run sub command.
-
-          Optional arguments are shown in square brackets above. Please visit our docs
-        at "https://CCBR.github.io/RENEE/" for more information, examples, and
-        guides.
-
-        {1}{2}Required arguments:{4}
-          --ref-fa REF_FA
-                              Genomic FASTA file of the reference genome. If you are
-                              downloading this from GENCODE, you should select the 'PRI'
-                              genomic FASTA file. This file will contain the primary
-                              genomic assembly (contains chromosomes and scaffolds).
-                                Example: --ref-fa GRCh38.primary_assembly.genome.fa
-          --ref-name REF_NAME
-                              Name of the input reference genome. This is the
-                              common name of the reference genome. Here is a list
-                              of common examples for different model organisms:
-                              mm10, hg38, rn6, danRer11, dm6, canFam3, sacCer3, ce11.
-                                Example: --ref-name GRCh38
-          --ref-gtf REF_GTF
-                              Annotation file or GTF file for the reference genome.
-                              If you are downloading this from GENCODE, you should select
-                              the 'PRI' GTF file. This file contains gene annotations for
-                              the primary assembly (contains chromosomes and scaffolds).
-                                Example: --ref-gtf gencode.v41.primary_assembly.gtf
-          --gtf-ver GTF_VER
-                              Version of the annotation file or GTF file provided.
-                              If you are using a GTF file from GENCODE, use the release
-                              number or version (i.e. 'M25' for mouse or '37' for human).
-                              Visit gencodegenes.org for more details.
-                                Example: --gtf-ver 41
-          --output OUTPUT
-                              Path to an output directory. This location is where the
-                              pipeline will create all of its output files. If the user
-                              provided working directory does not exist, it will be auto-
-                              matically created.
-                                Example: --output /data/$USER/refs/GRCh38_41
-
-        {1}{2}Build options:{4}
-          --shared-resources SHARED_RESOURCES
-                              Path to download shared resources. The pipeline uses a
-                              set of shared reference files that can be re-used across
-                              reference genomes. These currently include reference files
-                              for kraken and FQScreen. With that being said, these files
-                              can be downloaded once in a shared or common location. If
-                              you are running the pipeline on Biowulf, you do NOT need
-                              to download these reference files. They already exist in
-                              an accessible location on the filesystem. If you're setting
-                              up the pipeline on a new cluster or target system, you will
-                              need to provide this option at least one time. The path
-                              provided to this option can be provided to the renee
-                              run sub command via the --shared-resources option.
-                                Example: --shared-resources /data/shared/renee
-
-          --small-genome      Builds a small genome index. For small genomes, it is
-                              recommended running STAR with --genomeSAindexNbases value
-                              scaled down. This option runs the build pipeline in a
-                              mode where it dynamically finds the optimal value based
-                              on the following: min(14, log2(GenomeSize)/2 - 1).
-                                Example: --small-genome
-
-        {1}{2}Orchestration options:{4}
-          --dry-run           Does not execute anything. Only displays what steps in
-                              the pipeline remain or will be run.
-                                Example: --dry-run
-
-          --singularity-cache SINGULARITY_CACHE
-                              Overrides the $SINGULARITY_CACHEDIR variable. Images
-                              from remote registries are cached locally on the file
-                              system. By default, the singularity cache is set to:
-                              '/path/to/output/directory/.singularity/'. Please note
-                              that this cache cannot be shared across users.
-                                Example: --singularity-cache /data/$USER
+    # Help text is only rendered when it is requested
+    required_build_options = build_epilog = None
+    if _help_requested():
+        required_build_options = _build_options_help.format(*_styles)
 
-          --sif-cache SIF_CACHE
-                              Path where a local cache of SIFs are stored. This cache
-                              can be shared across users if permissions are properly
-                              setup. If a SIF does not exist in the SIF cache, the
-                              image will be pulled from Dockerhub. renee cache
-                              sub command can be used to create a local SIF cache.
-                              Please see renee cache for more information.
-                                Example: --sif-cache /data/$USER/sifs/
-
-          --tmp-dir TMP_DIR
-                            Path on the file system for writing temporary output
-                            files. By default, the temporary directory is set to
-                            '/lscratch/$SLURM_JOBID' on NIH's Biowulf cluster and
-                            'outdir' on the FRCE cluster.
-                            However, if you are running the pipeline on another cluster,
-                            this option will need to be specified.
-                            Ideally, this path should point to a dedicated location on
-                            the filesystem for writing tmp files.
-                            On many systems, this location is
-                            set to somewhere in /scratch. If you need to inject a
-                            variable into this string that should NOT be expanded,
-                            please quote this options value in single quotes.
-                                Example: --tmp-dir '/cluster_scratch/$USER/'
-
-          --wait
-                                Wait until master job completes. This is required if
-                                the job is submitted using HPC API. If not provided
-                                the API may interpret submission of master job as
-                                completion of the pipeline!
-
-        {1}{2}Misc Options:{4}
-          -h, --help          Show usage information, help message, and exit.
-                                Example: --help
-        """.format(
-            "renee", c.bold, c.url, c.italic, c.end
-        )
-    )
+        # Prebuilt genome+annotation combos
+        genomes = get_genomes_list()
 
-    # Display example usage in epilog
-    build_epilog = textwrap.dedent(
-        """
-        {2}{3}Example:{4}
-          # Step 1.) Grab an interactive node,
-          # do not run on head node and add
-          # required dependencies to $PATH
-          srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
-          module purge
-          module load singularity snakemake
-
-          # Step 2B.) Dry-run the build pipeline
-          renee build --ref-fa GRCm39.primary_assembly.genome.fa \\
-                         --ref-name mm39 \\
-                         --ref-gtf gencode.vM26.annotation.gtf \\
-                         --gtf-ver M26 \\
-                         --output /data/$USER/refs/mm39_M26 \\
-                         --dry-run
-
-          # Step 2A.) Build {0} reference files
-          renee build --ref-fa GRCm39.primary_assembly.genome.fa \\
-                         --ref-name mm39 \\
-                         --ref-gtf gencode.vM26.annotation.gtf \\
-                         --gtf-ver M26 \\
-                         --output /data/$USER/refs/mm39_M26
-
-        {2}{3}Version:{4}
-          {1}
-
-        {2}{3}Prebuilt genome+annotation combos:{4}
-          {5}
-        """.format(
-            "renee",
-            __version__,
-            c.bold,
-            c.url,
-            c.end,
-            list(get_genomes_list(repo_base=renee_base)),
-        )
-    )
+        # Display example usage in epilog
+        build_epilog = _build_epilog.format(*_version_styles(), genomes)
 
     # Suppressing help message of required args to overcome no sub-parser named groups
     subparser_build = subparsers.add_parser(
         "build",
-        help="Builds the reference files for the RENEE pipeline.",
+        help=help_message,
         usage=argparse.SUPPRESS,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         description=required_build_options,
@@ -1157,7 +1476,7 @@ def parsed_arguments(name, description):
     subparser_build.add_argument(
         "--ref-fa",
         # Check if the file exists and if it is readable
-        type=lambda file: permissions(parser, file, os.R_OK),
+        type=functools.partial(permissions, parser, mode=os.R_OK),
         required=True,
         help=argparse.SUPPRESS,
     )
@@ -1171,7 +1490,7 @@ def parsed_arguments(name, description):
     subparser_build.add_argument(
         "--ref-gtf",
         # Check if the file exists and if it is readable
-        type=lambda file: permissions(parser, file, os.R_OK),
+        type=functools.partial(permissions, parser, mode=os.R_OK),
         required=True,
         help=argparse.SUPPRESS,
     )
@@ -1185,7 +1504,7 @@ def parsed_arguments(name, description):
     # build working directory
     subparser_build.add_argument(
         "--output",
-        type=lambda option: os.path.abspath(os.path.expanduser(option)),
+        type=_abspath,
         required=True,
         help=argparse.SUPPRESS,
     )
@@ -1207,7 +1526,7 @@ def parsed_arguments(name, description):
     # Path to download shared refs
     subparser_build.add_argument(
         "--shared-resources",
-        type=lambda option: os.path.abspath(os.path.expanduser(option)),
+        type=_abspath,
         required=False,
         default=None,
         help=argparse.SUPPRESS,
@@ -1226,9 +1545,7 @@ def parsed_arguments(name, description):
     # default uses output directory
     subparser_build.add_argument(
         "--singularity-cache",
-        type=lambda option: check_cache(
-            parser, os.path.abspath(os.path.expanduser(option))
-        ),
+        type=functools.partial(_cache_abspath, parser),
         required=False,
         help=argparse.SUPPRESS,
     )
@@ -1237,7 +1554,7 @@ def parsed_arguments(name, description):
     # default pull from Dockerhub
     subparser_build.add_argument(
         "--sif-cache",
-        type=lambda option: os.path.abspath(os.path.expanduser(option)),
+        type=_abspath,
         required=False,
         help=argparse.SUPPRESS,
     )
@@ -1264,72 +1581,36 @@ def parsed_arguments(name, description):
                                 completion of the pipeline!",
     )
 
+    subparser_build.set_defaults(func=build)
+
+
+def _add_unlock_parser(parser, subparsers, help_message):
+    """Adds the "unlock" sub-command to the top-level parser.
+    @param parser <argparse.ArgumentParser() object>:
+        Top-level parser, used to report invalid arguments
+    @param subparsers <argparse._SubParsersAction object>:
+        Sub-command parsers of the top-level parser
+    @param help_message <str>:
+        Short help message listed in the top-level usage
+    """
     # Sub-parser for the "unlock" sub-command
     # Grouped sub-parser arguments are currently
     # not supported: https://bugs.python.org/issue9341
     # Here is a work around to create more useful help message for named
     # options that are required! Please note: if a required arg is added the
     # description below should be updated (i.e. update usage and add new option)
-    required_unlock_options = textwrap.dedent(
-        """\
-        {1}{0} {3}unlock{4}: {1}Unlocks a previous output directory.{4}
-
-        {1}{2}Synopsis:{4}
-          $ {0} unlock [--help] --output OUTPUT
-
-        {1}{2}Description:{4}
-          If the pipeline fails ungracefully, it maybe required to unlock
-        the working directory before proceeding again. Please verify that
-        the pipeline is not running before running this command. If the
-        pipeline is still running, the workflow manager will report the
-        working directory is locked. This is normal behavior. Do NOT run
-        this command if the pipeline is still running.
-
-          Optional arguments are shown in square brackets above. Please
-        visit our docs at "https://CCBR.github.io/RENEE/" for more
-        information, examples, and guides.
-
-        {1}{2}Required arguments:{4}
-          --output OUTPUT       Path to a previous run's output directory
-                                to unlock. This will remove a lock on the
-                                working directory. Please verify that the
-                                pipeline is not running before running
-                                this command.
-                                  Example: --output /data/$USER/output
-
-        {1}{2}Misc Options:{4}
-          -h, --help            Show usage information and exit.
-                                  Example: --help
-        """.format(
-            "renee", c.bold, c.url, c.italic, c.end
-        )
-    )
+    # Help text is only rendered when it is requested
+    required_unlock_options = unlock_epilog = None
+    if _help_requested():
+        required_unlock_options = _unlock_options_help.format(*_styles)
 
-    # Display example usage in epilog
-    unlock_epilog = textwrap.dedent(
-        """\
-        {2}{3}Example:{4}
-          # Step 1.) Grab an interactive node,
-          # do not run on head node and add
-          # required dependencies to $PATH
-          srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
-          module purge
-          module load singularity snakemake
-
-          # Step 2.) Unlock output directory of pipeline
-          {0} unlock --output /data/$USER/output
-
-        {2}{3}Version:{4}
-          {1}
-        """.format(
-            "renee", __version__, c.bold, c.url, c.end
-        )
-    )
+        # Display example usage in epilog
+        unlock_epilog = _unlock_epilog.format(*_version_styles())
 
     # Suppressing help message of required args to overcome no sub-parser named groups
     subparser_unlock = subparsers.add_parser(
         "unlock",
-        help="Unlocks a previous runs output directory.",
+        help=help_message,
         usage=argparse.SUPPRESS,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         description=required_unlock_options,
@@ -1346,91 +1627,37 @@ def parsed_arguments(name, description):
     # Add custom help message
     subparser_unlock.add_argument("-h", "--help", action="help", help=argparse.SUPPRESS)
 
+    subparser_unlock.set_defaults(func=unlock)
+
+
+def _add_cache_parser(parser, subparsers, help_message):
+    """Adds the "cache" sub-command to the top-level parser.
+    @param parser <argparse.ArgumentParser() object>:
+        Top-level parser, used to report invalid arguments
+    @param subparsers <argparse._SubParsersAction object>:
+        Sub-command parsers of the top-level parser
+    @param help_message <str>:
+        Short help message listed in the top-level usage
+    """
     # Sub-parser for the "cache" sub-command
     # Grouped sub-parser arguments are
     # not supported: https://bugs.python.org/issue9341
     # Here is a work around to create more useful help message for named
     # options that are required! Please note: if a required arg is added the
     # description below should be updated (i.e. update usage and add new option)
-    required_cache_options = textwrap.dedent(
-        """\
-        {1}{0} {3}cache{4}: {1}Cache software containers locally.{4}
-
-        {1}{2}Synopsis:{4}
-          $ {0} cache [--help] [--dry-run] \\
-                  --sif-cache SIF_CACHE
-
-        {1}{2}Description:{4}
-        Create a local cache of software dependencies hosted on DockerHub.
-        These containers are normally pulled onto the filesystem when the
-        pipeline runs; however, due to network issues or DockerHub pull
-        rate limits, it may make sense to pull the resources once so a
-        shared cache can be created. It is worth noting that a singularity
-        cache cannot normally be shared across users. Singularity strictly
-        enforces that a cache is owned by the user. To get around this
-        issue, the cache subcommand can be used to create local SIFs on
-        the filesystem from images on DockerHub.
-
-        Optional arguments are shown in square brackets above. Please visit
-        our docs at "https://CCBR.github.io/RENEE/" for more info,
-        examples, and guides.
-
-        {1}{2}Required arguments:{4}
-          --sif-cache SIF_CACHE
-                                Path where a local cache of SIFs will be
-                                stored. Images defined in containers.json
-                                will be pulled into the local filesystem.
-                                The path provided to this option can be
-                                passed to the --sif-cache option of the
-                                run sub command. Please see {0} run
-                                sub command for more information.
-                                  Example: --sif-cache /data/$USER/cache
-
-        {1}{2}Orchestration options:{4}
-          --dry-run             Does not execute anything. Only displays
-                                what remote resources would be pulled.
-                                  Example: --dry-run
-
-        {1}{2}Misc Options:{4}
-          -h, --help            Show usage information and exits.
-                                  Example: --help
-        """.format(
-            "renee", c.bold, c.url, c.italic, c.end
-        )
-    )
+    # Help text is only rendered when it is requested
+    required_cache_options = cache_epilog = None
+    if _help_requested():
+        required_cache_options = _cache_options_help.format(*_styles)
 
-    # Display example usage in epilog
-    cache_epilog = textwrap.dedent(
-        """\
-        {2}Example:{3}
-          # Step 1.) Grab an interactive node,
-          # do not run on head node and add
-          # required dependencies to $PATH
-          srun -N 1 -n 1 --time=1:00:00 --mem=8gb  --cpus-per-task=2 --pty bash
-          module purge
-          module load singularity snakemake
-
-          # Step 2A.) Dry-run cache to see
-          # what software containers will
-          # be pulled from Dockerhub
-          {0} cache --sif-cache /data/$USER/cache \\
-                    --dry-run
-
-          # Step 2B.) Cache software containers
-          {0} cache --sif-cache /data/$USER/cache
-
-        {2}Version:{3}
-          {1}
-        """.format(
-            "renee", __version__, c.bold, c.end
-        )
-    )
+        # Display example usage in epilog
+        cache_epilog = _cache_epilog.format(*_version_styles())
 
     # Suppressing help message of required args
     # to overcome no sub-parser named groups
     subparser_cache = subparsers.add_parser(
         "cache",
-        help="Cache software containers locally.",
+        help=help_message,
         usage=argparse.SUPPRESS,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         description=required_cache_options,
@@ -1442,7 +1669,7 @@ def parsed_arguments(name, description):
     # Output Directory (analysis working directory)
     subparser_cache.add_argument(
         "--sif-cache",
-        type=lambda option: os.path.abspath(os.path.expanduser(option)),
+        type=_abspath,
         required=True,
         help=argparse.SUPPRESS,
     )
@@ -1460,25 +1687,113 @@ def parsed_arguments(name, description):
     # Add custom help message
     subparser_cache.add_argument("-h", "--help", action="help", help=argparse.SUPPRESS)
 
+    subparser_cache.set_defaults(func=cache)
+
+
+def _add_debug_parser(parser, subparsers, help_message):
+    """Adds the "debug" sub-command to the top-level parser.
+    @param parser <argparse.ArgumentParser() object>:
+        Top-level parser, used to report invalid arguments
+    @param subparsers <argparse._SubParsersAction object>:
+        Sub-command parsers of the top-level parser
+    @param help_message <str>:
+        Short help message listed in the top-level usage
+    """
     subparser_debug = subparsers.add_parser(
         "debug",
-        help="Debug the RENEE pipeline base directory.",
+        help=help_message,
         usage=argparse.SUPPRESS,
     )
-
-    # Define handlers for each sub-parser
-    subparser_run.set_defaults(func=run)
     subparser_debug.set_defaults(func=debug)
-    subparser_unlock.set_defaults(func=unlock)
-    subparser_build.set_defaults(func=build)
-    subparser_cache.set_defaults(func=cache)
-    subparser_gui.set_defaults(func=launch_gui)
+
+
+def _help_requested():
+    # Descriptions and epilogs of sub-commands are only shown by -h/--help
+    return any(arg in ("-h", "--help") for arg in sys.argv[1:])
+
+
+# Sub-commands in the order they are listed in the top-level usage,
+# mapped to their short help message and the function that adds them
+_subcommands = {
+    "run": ("Run the RENEE pipeline with your FastQ files.", _add_run_parser),
+    "gui": (
+        "Launch the RENEE pipeline with a Graphical User Interface (GUI)",
+        _add_gui_parser,
+    ),
+    "build": ("Builds the reference files for the RENEE pipeline.", _add_build_parser),
+    "unlock": ("Unlocks a previous runs output directory.", _add_unlock_parser),
+    "cache": ("Cache software containers locally.", _add_cache_parser),
+    "debug": ("Debug the RENEE pipeline base directory.", _add_debug_parser),
+}
+
+
+def parsed_arguments(name, description):
+    """Parses user-provided command-line arguments. Requires argparse package,
+    argparse was added to standard lib in python 3.2. To create custom help formatting
+    for subparsers a module-level template is used to create the help message for
+    required options. argparse does not support named
+    subparser groups, which is normally what would be used to accomphish this reformatting.
+    As so, the help message for require options must be suppressed. If a new required arg
+    is added to a subparser, it must be added to the template and the usage statement
+    also must be updated. Only the selected sub-command is fully built, the others
+    are added as stubs so they are still listed in the top-level usage.
+    @param name <str>:
+        Name of the pipeline or command-line tool
+    @param description <str>:
+        Short description of pipeline or command-line tool
+    """
+    # Add styled name and description
+    c = Colors
+    description = "{0}{1}{2}".format(c.bold, description, c.end)
+
+    # Create a top-level parser
+    parser = argparse.ArgumentParser(prog="renee", description=description)
+
+    # Adding Version information
+    parser.add_argument("--version", action=VersionAction)
+    # Create sub-command parser
+    subparsers = parser.add_subparsers(help="List of available sub-commands")
+
+    # Only build the options of the selected sub-command
+    selected = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    for subcommand, (help_message, add_parser) in _subcommands.items():
+        if subcommand == selected:
+            add_parser(parser, subparsers, help_message)
+        else:
+            subparsers.add_parser(subcommand, help=help_message)
 
     # Parse command-line args
     args = parser.parse_args()
+    if selected == "run":
+        bulk_exists(parser, args.input)
     return args
 
 
+def _run(sub_args):
+    # Subcommand modules are imported on use to keep CLI start-up fast
+    from .run import run
+
+    if sub_args.sif_cache is None:
+        # Default SIF cache of the cluster, string
+        # defaults are converted like the option itself
+        sif_cache = get_sif_cache_dir(hpc=get_hpcname())
+        sub_args.sif_cache = (
+            _abspath(sif_cache) if isinstance(sif_cache, str) else sif_cache
+        )
+    run(sub_args)
+
+
+def _launch_gui(sub_args):
+    import logging
+    from .gui import launch_gui
+
+    # Debug output of the GUI is enabled by setting RENEE_DEBUG
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("RENEE_DEBUG") else logging.WARNING
+    )
+    launch_gui(sub_args)
+
+
 def debug(args):
     print("RENEE BASE:", renee_base(debug=True))
     print(get_version(debug=True))
@@ -1494,7 +1809,7 @@ def main():
     args = parsed_arguments(name=_name, description=_description)
 
     # Display version information
-    print("RENEE ({})".format(__version__))
+    print("RENEE ({})".format(get_version()))
 
     # Mediator method to call sub-command's set handler function
     args.func(args)
@@ -1,5 +1,9 @@
+import codecs
+import contextlib
 import datetime
+import functools
 import os
+import shutil
 import subprocess
 import sys
 
@@ -11,27 +15,25 @@ def dryrun(
     write_to_file=True,
 ):
     """Dryruns the pipeline to ensure there are no errors prior to running.
+    The output of the dryrun is streamed to stdout while it runs.
     @param outdir <str>:
         Pipeline output PATH
-    @return dryrun_output <str>:
-        Byte string representation of dryrun command
+    @param write_to_file <bool>:
+        Also stream the output to outdir/dryrun.<timestamp>.log
     """
+    command = [
+        "snakemake",
+        "-npr",
+        "-s",
+        str(snakefile),
+        "--use-singularity",
+        "--rerun-incomplete",
+        "--cores",
+        "4",
+        "--configfile={}".format(config),
+    ]
     try:
-        dryrun_output = subprocess.check_output(
-            [
-                "snakemake",
-                "-npr",
-                "-s",
-                str(snakefile),
-                "--use-singularity",
-                "--rerun-incomplete",
-                "--cores",
-                "4",
-                "--configfile={}".format(config),
-            ],
-            cwd=outdir,
-            stderr=subprocess.STDOUT,
-        )
+        _stream_output(command, outdir, write_to_file)
 
     except subprocess.CalledProcessError as e:
         # Singularity is NOT in $PATH
@@ -39,7 +41,8 @@ def dryrun(
         print(
             "Are singularity and snakemake in your PATH? Please check before proceeding again!"
         )
-        sys.exit("{}\n{}".format(e, e.output.decode("utf-8")))
+        # the output of the failed dryrun was already streamed to stdout
+        sys.exit("{}".format(e))
     except OSError as e:
         # Catch: OSError: [Errno 2] No such file or directory
         #  Occurs when command returns a non-zero exit-code
@@ -54,12 +57,38 @@ def dryrun(
             # Failure caused by unknown cause, raise error
             raise e
 
-    if write_to_file:
-        now = _now()
-        with open(os.path.join(outdir, "dryrun." + str(now) + ".log"), "w") as outfile:
-            outfile.write("{}".format(dryrun_output.decode("utf-8")))
 
-    return dryrun_output
+def _stream_output(command, outdir, write_to_file=True):
+    """Private function for dryrun() that runs a command and streams its combined
+    stdout/stderr to stdout, and to outdir/dryrun.<timestamp>.log, while it runs.
+    Only one chunk of the output is held in memory at a time.
+    @param command list[<str>]:
+        Command to run
+    @param outdir <str>:
+        Working directory of the command, the log is written here
+    @param write_to_file <bool>:
+        Write the output to a log file
+    """
+    # Decodes multi-byte characters split across chunks
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with subprocess.Popen(
+        command, cwd=outdir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    ) as process:
+        logfile = (
+            open(os.path.join(outdir, "dryrun." + str(_now()) + ".log"), "wb")
+            if write_to_file
+            else contextlib.nullcontext()
+        )
+        with logfile:
+            # read1 returns whatever is available instead of waiting for a full chunk
+            for chunk in iter(lambda: process.stdout.read1(65536), b""):
+                if write_to_file:
+                    logfile.write(chunk)
+                sys.stdout.write(decoder.decode(chunk))
+                sys.stdout.flush()
+        sys.stdout.write(decoder.decode(b"", final=True))
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
 
 
 def _now():
@@ -78,12 +107,13 @@ def exe_in_path(cmd, path=None):
         True if exe in PATH, False if not in PATH
     """
     if path is None:
-        path = os.environ["PATH"].split(os.pathsep)
+        path = os.environ.get("PATH", os.defpath)
+    else:
+        path = os.pathsep.join(path)
+    return _which(cmd, path) is not None
+
 
-    for prefix in path:
-        filename = os.path.join(prefix, cmd)
-        executable = os.access(filename, os.X_OK)
-        is_not_directory = os.path.isfile(filename)
-        if executable and is_not_directory:
-            return True
-    return False
+@functools.lru_cache(maxsize=32)
+def _which(cmd, path):
+    # Cached on the search path too, a new $PATH forces a new lookup
+    return shutil.which(cmd, path=path)
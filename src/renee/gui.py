@@ -1,40 +1,46 @@
 #!/usr/bin/env python3
 import argparse
-import glob
-import io
+import functools
+import logging
 import os
-import PySimpleGUI as sg
 import sys
-from tkinter import Tk
 
-from ccbr_tools.pipeline.util import (
-    get_genomes_dict,
-    get_tmp_dir,
-    get_hpcname,
-)
+from ccbr_tools.pipeline.util import get_tmp_dir
 from ccbr_tools.pipeline.cache import get_sif_cache_dir, get_singularity_cachedir
 from ccbr_tools.shell import exec_in_context
 
-from .util import get_version, renee_base, get_shared_resources_dir
+from .util import (
+    get_version,
+    renee_base,
+    get_shared_resources_dir,
+    get_genomes_dict,
+    get_hpcname,
+)
 from .run import run
 
-# TODO: get rid of  all the global variables
-# TODO: let's use a tmp dir and put these files there instead. see for inspiration:https://github.com/CCBR/RENEE/blob/16d13dca1d5f0f43c7dfda379efb882a67635d17/tests/test_cache.py#L14-L28
-global FILES_TO_DELETE
-FILES_TO_DELETE = list()
+_log = logging.getLogger(__name__)
 
+# shared styling for popups
+POPUP_STYLE = {"location": (0, 500), "font": ("Arial", 12, "bold")}
+SCROLLED_STYLE = {"location": (0, 500), "font": ("Monaco", 10), "size": (80, 30)}
+LOGO_PATH = renee_base("resources", "CCBRlogo.png")
 
-def launch_gui(sub_args, debug=True):
-    # get drop down genome+annotation options
-    jsons = get_genomes_dict(repo_base=renee_base, error_on_warnings=True)
-    genome_annotation_combinations = list(jsons.keys())
-    genome_annotation_combinations.sort()
-    if debug:
-        print(jsons)
+
+def launch_gui(sub_args, debug=False):
+    # imported here so the rest of the CLI does not pay for loading Tk
+    import PySimpleGUI as sg
+
+    # handlers are configured by the caller, i.e. the renee gui sub-command
     if debug:
-        print(genome_annotation_combinations)
+        _log.setLevel(logging.DEBUG)
+
+    # get drop down genome+annotation options
+    jsons = get_genomes_dict(error_on_warnings=True)
+    genome_annotation_combinations = list(jsons)
+    _log.debug("%s", jsons)
+    _log.debug("%s", genome_annotation_combinations)
 
-    logo = sg.Image(renee_base(os.path.join("resources", "CCBRlogo.png")))
+    logo = sg.Image(LOGO_PATH)
     # create layout
     layout = [
         [sg.Column([[logo]], justification="center")],
@@ -72,178 +78,189 @@ def launch_gui(sub_args, debug=True):
             sg.Button(button_text="Help", key="--HELP--", font=("Helvetica", 12)),
         ],
     ]
-    if debug:
-        print("layout is ready!")
+    _log.debug("layout is ready!")
 
     window = sg.Window(
         f"RENEE {get_version()}", layout, location=(0, 500), finalize=True
     )
-    if debug:
-        print("window created!")
+    _log.debug("window created!")
 
-    while True:
-        event, values = window.read()
-        if debug:
-            print(event, values)
-        # if any((event != 'Submit')):
-        if event == "--CANCEL--" or event == sg.WIN_CLOSED:
-            sg.popup_auto_close(
-                "Thank you for running RENEE. GoodBye!",
-                location=(0, 500),
-                title="",
-                font=("Arial", 12, "bold"),
-            )
-            sys.exit(69)
-        if event == "--DOC--":
-            copy_to_clipboard("https://ccbr.github.io/RENEE/")
-            sg.Popup(
-                "Visit https://ccbr.github.io/RENEE/ for links to complete documentation. The link has been copied to your clipboard. Please paste it in your favorite web browser.",
-                font=("Arial", 12, "bold"),
-                location=(0, 500),
-            )
-            continue
-        if event == "--HELP--":
-            copy_to_clipboard("ccbr_pipeliner@mail.nih.gov")
-            sg.Popup(
-                "Email ccbr_pipeliner@mail.nih.gov for help. The email id has been copied to your clipboard. Please paste it in your emailing software.",
-                font=("Arial", 12, "bold"),
-                location=(0, 500),
-            )
-            continue
-        if event == "--SUBMIT--":
-            if values["--INDIR--"] == "":
-                sg.PopupError(
-                    "Input folder must be provided!!",
-                    location=(0, 500),
-                    title="ERROR!",
-                    font=("Arial", 12, "bold"),
+    # run options that are the same for every submission
+    hpcname = get_hpcname()
+    sif_cache = get_sif_cache_dir(hpc=hpcname)
+    shared_resources = get_shared_resources_dir(None, hpc=hpcname)
+
+    try:
+        while True:
+            event, values = window.read()
+            _log.debug("%s %s", event, values)
+            # if any((event != 'Submit')):
+            if event == "--CANCEL--" or event == sg.WIN_CLOSED:
+                sg.popup_auto_close(
+                    "Thank you for running RENEE. GoodBye!",
+                    title="",
+                    **POPUP_STYLE,
+                )
+                sys.exit(69)
+            if event == "--DOC--":
+                copy_to_clipboard("https://ccbr.github.io/RENEE/")
+                sg.Popup(
+                    "Visit https://ccbr.github.io/RENEE/ for links to complete documentation. The link has been copied to your clipboard. Please paste it in your favorite web browser.",
+                    **POPUP_STYLE,
                 )
                 continue
-            elif not os.path.exists(values["--INDIR--"]) and not os.path.exists(
-                fixpath(values["--INDIR--"])
-            ):
-                if debug:
-                    print(values["--INDIR--"])
-                if debug:
-                    print(fixpath(values["--INDIR--"]))
-                sg.PopupError(
-                    "Input folder doesn't exist!!",
-                    location=(0, 500),
-                    title="ERROR!",
-                    font=("Arial", 12, "bold"),
+            if event == "--HELP--":
+                copy_to_clipboard("ccbr_pipeliner@mail.nih.gov")
+                sg.Popup(
+                    "Email ccbr_pipeliner@mail.nih.gov for help. The email id has been copied to your clipboard. Please paste it in your emailing software.",
+                    **POPUP_STYLE,
                 )
                 continue
-            else:
-                inputfastqs = get_fastqs(values["--INDIR--"])
-                if debug:
-                    print(inputfastqs)
-                if len(inputfastqs) == 0:
+            if event == "--SUBMIT--":
+                indir = fixpath(values["--INDIR--"])
+                outdir = fixpath(values["--OUTDIR--"])
+                if values["--INDIR--"] == "":
                     sg.PopupError(
-                        "Input folder has no fastqs!!",
-                        location=(0, 500),
+                        "Input folder must be provided!!",
                         title="ERROR!",
-                        font=("Arial", 12, "bold"),
+                        **POPUP_STYLE,
                     )
-                    window.Element("--INDIR--").update("")
                     continue
-            if values["--OUTDIR--"] == "":
-                sg.PopupError(
-                    "Output folder must be provided!!",
-                    location=(0, 500),
-                    title="ERROR",
-                    font=("Arial", 12, "bold"),
-                )
-                continue
-            elif os.path.exists(values["--OUTDIR--"]) and not os.path.exists(
-                fixpath(values["--OUTDIR--"])
-            ):
-                ch = sg.popup_yes_no(
-                    "Output folder exists... this is probably a re-run ... proceed?",
-                    title="Rerun?",
-                    location=(0, 500),
-                    font=("Arial", 12, "bold"),
-                )
-                if ch == "No":
-                    window.Element("--OUTDIR--").update("")
+                elif not os.path.exists(indir):
+                    _log.debug("%s", values["--INDIR--"])
+                    _log.debug("%s", indir)
+                    sg.PopupError(
+                        "Input folder doesn't exist!!",
+                        title="ERROR!",
+                        **POPUP_STYLE,
+                    )
                     continue
-                # sg.Popup("Output folder exists... this is probably a re-run ... is it?",location=(0,500))
-            genome = jsons[values["--ANNOTATION--"]]
-            output_dir = values["--OUTDIR--"]
-            # create sub args for renee run
-            run_args = argparse.Namespace(
-                input=inputfastqs,
-                output=output_dir,
-                genome=genome,
-                mode="slurm",
-                runmode="run",
-                dry_run=True,
-                sif_cache=get_sif_cache_dir(hpc=get_hpcname()),
-                singularity_cache=get_singularity_cachedir(
-                    output_dir, os.environ.get("SINGULARITY_CACHEDIR", None)
-                ),
-                tmp_dir=get_tmp_dir(None, output_dir),
-                shared_resources=get_shared_resources_dir(None),
-                star_2_pass_basic=False,
-                small_rna=False,
-                create_nidap_folder=False,
-                wait=False,
-                threads=2,
-            )
-            # execute dry run and capture stdout/stderr
-            allout = exec_in_context(run, run_args)
-            sg.popup_scrolled(
-                allout,
-                title="Dryrun:STDOUT/STDERR",
-                font=("Monaco", 10),
-                location=(0, 500),
-                size=(80, 30),
-            )
-            # TODO use a regex to simplify this line
-            if "error" in allout or "Error" in allout or "ERROR" in allout:
-                continue
-            ch = sg.popup_yes_no(
-                "Submit run to slurm?",
-                title="Submit??",
-                location=(0, 500),
-                font=("Arial", 12, "bold"),
-            )
-            if ch == "Yes":
-                run_args.dry_run = False
-                # execute live run
-                allout = exec_in_context(run, run_args)
-                sg.popup_scrolled(
-                    allout,
-                    title="Dryrun:STDOUT/STDERR",
-                    font=("Monaco", 10),
-                    location=(0, 500),
-                    size=(80, 30),
+                else:
+                    inputfastqs = get_fastqs(indir)
+                    _log.debug("%s", inputfastqs)
+                    if len(inputfastqs) == 0:
+                        sg.PopupError(
+                            "Input folder has no fastqs!!",
+                            title="ERROR!",
+                            **POPUP_STYLE,
+                        )
+                        window.Element("--INDIR--").update("")
+                        continue
+                if values["--OUTDIR--"] == "":
+                    sg.PopupError(
+                        "Output folder must be provided!!",
+                        title="ERROR",
+                        **POPUP_STYLE,
+                    )
+                    continue
+                elif os.path.exists(outdir):
+                    ch = sg.popup_yes_no(
+                        "Output folder exists... this is probably a re-run ... proceed?",
+                        title="Rerun?",
+                        **POPUP_STYLE,
+                    )
+                    if ch == "No":
+                        window.Element("--OUTDIR--").update("")
+                        continue
+                    # sg.Popup("Output folder exists... this is probably a re-run ... is it?",location=(0,500))
+                genome = jsons[values["--ANNOTATION--"]]
+                output_dir = outdir
+                # create sub args for renee run
+                run_args = argparse.Namespace(
+                    input=inputfastqs,
+                    output=output_dir,
+                    genome=genome,
+                    mode="slurm",
+                    runmode="run",
+                    dry_run=True,
+                    sif_cache=sif_cache,
+                    singularity_cache=get_singularity_cachedir(
+                        output_dir, os.environ.get("SINGULARITY_CACHEDIR", None)
+                    ),
+                    tmp_dir=get_tmp_dir(None, output_dir, hpc=hpcname),
+                    shared_resources=shared_resources,
+                    star_2_pass_basic=False,
+                    small_rna=False,
+                    create_nidap_folder=False,
+                    wait=False,
+                    threads=2,
                 )
+                # execute dry run and capture stdout/stderr
+                success, allout = run_in_context(run_args)
                 sg.popup_scrolled(
                     allout,
-                    title="Slurmrun:STDOUT/STDERR",
-                    font=("Monaco", 10),
-                    location=(0, 500),
-                    size=(80, 30),
+                    title="Dryrun:STDOUT/STDERR",
+                    **SCROLLED_STYLE,
                 )
-                sg.popup_auto_close(
-                    "Thank you for running RENEE. GoodBye!",
-                    location=(0, 500),
-                    title="",
-                    font=("Arial", 12, "bold"),
+                if not success:
+                    continue
+                ch = sg.popup_yes_no(
+                    "Submit run to slurm?",
+                    title="Submit??",
+                    **POPUP_STYLE,
                 )
-                break
-            elif ch == "No":
-                window.Element("--INDIR--").update("")
-                window.Element("--OUTDIR--").update("")
-                window.Element("--ANNOTATION--").update("")
-                continue
+                if ch == "Yes":
+                    run_args.dry_run = False
+                    # execute live run
+                    success, allout = run_in_context(run_args)
+                    sg.popup_scrolled(
+                        allout,
+                        title=(
+                            "Slurmrun:STDOUT/STDERR"
+                            if success
+                            else "Slurmrun:FAILED:STDOUT/STDERR"
+                        ),
+                        **SCROLLED_STYLE,
+                    )
+                    if not success:
+                        # keep the window open to fix the inputs and retry
+                        continue
+                    sg.popup_auto_close(
+                        "Thank you for running RENEE. GoodBye!",
+                        title="",
+                        **POPUP_STYLE,
+                    )
+                    break
+                elif ch == "No":
+                    window.Element("--INDIR--").update("")
+                    window.Element("--OUTDIR--").update("")
+                    window.Element("--ANNOTATION--").update("")
+                    continue
+    finally:
+        window.close()
+
 
-    window.close()
-    if len(FILES_TO_DELETE) != 0:
-        delete_files(FILES_TO_DELETE)
+def run_in_context(run_args):
+    """Runs renee run with exec_in_context() and reports whether it succeeded
+    @param run_args <argparse.Namespace>:
+        Parsed arguments for renee run
+    @return success, output tuple(<bool>, <str>):
+        Whether the run exited cleanly, and its combined stdout and stderr.
+        The dryrun output goes through sys.stdout and is included, output
+        that child processes write to file descriptors 1 and 2 is not.
+    """
+    success = True
+
+    def _run():
+        nonlocal success
+        try:
+            run(run_args)
+        except SystemExit as e:
+            # fatal() and a failed dryrun() exit instead of raising
+            success = e.code in (None, 0)
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+        except Exception as e:
+            success = False
+            print("{}: {}".format(type(e).__name__, e), file=sys.stderr)
+
+    allout = exec_in_context(_run)
+    return success, allout
 
 
 def copy_to_clipboard(string):
+    from tkinter import Tk
+
     r = Tk()
     r.withdraw()
     r.clipboard_clear()
@@ -258,16 +275,21 @@ def fixpath(p):
 
 def get_fastqs(inputdir):
     inputdir = fixpath(inputdir)
-    inputfastqs = glob.glob(inputdir + os.sep + "*.fastq.gz")
-    inputfqs = glob.glob(inputdir + os.sep + "*.fq.gz")
-    inputfastqs.extend(inputfqs)
-    return inputfastqs
+    return list(_scan_fastqs(inputdir, os.stat(inputdir).st_mtime_ns))
 
 
-def delete_files(files):
-    for f in files:
-        if os.path.exists(f):
-            os.remove(f)
+@functools.lru_cache(maxsize=8)
+def _scan_fastqs(inputdir, mtime):
+    # mtime is only part of the cache key, a new mtime forces a re-scan
+    with os.scandir(inputdir) as entries:
+        return tuple(
+            entry.path
+            for entry in entries
+            if not entry.name.startswith(".")
+            and entry.name.endswith((".fastq.gz", ".fq.gz"))
+            # Symlinked FastQs are common, follow them
+            and entry.is_file()
+        )
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 import os
-import re
+import stat
 import sys
 
-from ccbr_tools.pipeline.util import _cp_r_safe_, _sym_safe_
+from ccbr_tools.pipeline.util import _cp_r_safe_
+
+from .util import _sym_safe_
 
 
 def initialize(sub_args, repo_path, output_path):
@@ -23,11 +25,14 @@ def initialize(sub_args, repo_path, output_path):
     @return inputs list[<str>]:
         List of pipeline's input FastQ files
     """
-    if not os.path.exists(output_path):
+    try:
+        is_file = stat.S_ISREG(os.stat(output_path).st_mode)
+    except FileNotFoundError:
         # Pipeline output directory does not exist on filesystem
-        os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
+        is_file = False
 
-    elif os.path.exists(output_path) and os.path.isfile(output_path):
+    if is_file:
         # Provided Path for pipeline output directory exists as file
         raise OSError(
             """\n\tFatal: Failed to create provided pipeline output directory!
@@ -1,13 +1,12 @@
 import os
 import subprocess
+from datetime import datetime
 
-from ccbr_tools.pipeline.util import (
-    get_hpcname,
-    get_tmp_dir,
-    _get_file_mtime,
-)
+from ccbr_tools.pipeline.util import get_tmp_dir
 from ccbr_tools.pipeline.cache import get_singularity_cachedir
 
+from .util import get_hpcname
+
 
 def orchestrate(
     mode,
@@ -19,7 +18,7 @@ def orchestrate(
     masterjob="pl:renee",
     tmp_dir=None,
     wait="",
-    hpcname=get_hpcname(),
+    hpcname=None,
 ):
     """Runs RENEE pipeline via selected executor: local or slurm.
     If 'local' is selected, the pipeline is executed locally on a compute node/instance.
@@ -31,7 +30,7 @@ def orchestrate(
         Execution method or mode:
             local runs serially a compute instance without submitting to the cluster.
             slurm will submit jobs to the cluster using the SLURM job scheduler.
-    @param additional_bind_paths <str>:
+    @param additional_bind_paths list[<str>]:
         Additional paths to bind to container filesystem (i.e. input file paths)
     @param alt_cache <str>:
         Alternative singularity cache location
@@ -48,57 +47,58 @@ def orchestrate(
     @param wait <str>:
         "--wait" to wait for master job to finish. This waits when pipeline is called via NIDAP API
     @param hpcname <str>:
-        "biowulf" if run on biowulf, "frce" if run on frce, blank otherwise. hpcname is determined in setup() function
+        "biowulf" if run on biowulf, "frce" if run on frce, blank otherwise. hpcname is determined in setup() function,
+        defaults to the current cluster
     @return masterjob <subprocess.Popen() object>:
     """
+    if hpcname is None:
+        hpcname = get_hpcname()
     # Add additional singularity bind PATHs
     # to mount the local filesystem to the
     # containers filesystem, NOTE: these
     # PATHs must be an absolute PATHs
     outdir = os.path.abspath(outdir)
-    # Add any default PATHs to bind to
-    # the container's filesystem, like
-    # tmp directories, /lscratch
-    addpaths = []
     # set tmp_dir depending on hpc
-    tmp_dir = get_tmp_dir(tmp_dir, outdir)
+    tmp_dir = get_tmp_dir(tmp_dir, outdir, hpc=hpcname)
     temp = os.path.dirname(tmp_dir.rstrip("/"))
     if temp == os.sep:
         temp = tmp_dir.rstrip("/")
-    if outdir not in additional_bind_paths.split(","):
-        addpaths.append(outdir)
-    if temp not in additional_bind_paths.split(","):
-        addpaths.append(temp)
-    bindpaths = ",".join(addpaths)
+    # Add any default PATHs to bind to
+    # the container's filesystem, like
+    # the output and tmp directories, /lscratch,
+    # each PATH is only bound once
+    bindpaths = ",".join(
+        dict.fromkeys(path for path in [*additional_bind_paths, outdir, temp] if path)
+    )
 
     # Set ENV variable 'SINGULARITY_CACHEDIR'
     # to output directory
-    my_env = {}
-    my_env.update(os.environ)
+    my_env = os.environ.copy()
 
     cache = get_singularity_cachedir(output_dir=outdir, cache_dir=alt_cache)
     my_env["SINGULARITY_CACHEDIR"] = cache
 
-    if additional_bind_paths:
-        # Add Bind PATHs for outdir and tmp dir
-        if bindpaths:
-            bindpaths = ",{}".format(bindpaths)
-        bindpaths = "{}{}".format(additional_bind_paths, bindpaths)
-
-    if not os.path.exists(os.path.join(outdir, "logfiles")):
-        # Create directory for logfiles
-        os.makedirs(os.path.join(outdir, "logfiles"))
+    # Create directory for logfiles
+    logdir = os.path.join(outdir, "logfiles")
+    os.makedirs(logdir, exist_ok=True)
 
-    if os.path.exists(os.path.join(outdir, "logfiles", "snakemake.log")):
-        mtime = _get_file_mtime(os.path.join(outdir, "logfiles", "snakemake.log"))
-        newname = os.path.join(outdir, "logfiles", "snakemake." + str(mtime) + ".log")
-        os.rename(os.path.join(outdir, "logfiles", "snakemake.log"), newname)
+    # Rotate the log of a previous run, named after its
+    # modification time, one stat covers both checks
+    logfile = os.path.join(logdir, "snakemake.log")
+    try:
+        mtime = datetime.fromtimestamp(os.stat(logfile).st_mtime)
+    except FileNotFoundError:
+        pass
+    else:
+        newname = os.path.join(
+            logdir, "snakemake." + mtime.strftime("%y%m%d%H%M%S") + ".log"
+        )
+        os.replace(logfile, newname)
 
     # Create .singularity directory for installations of snakemake
     # without setuid which create a sandbox in the SINGULARITY_CACHEDIR
-    if not os.path.exists(cache):
-        # Create directory for sandbox and image layers
-        os.makedirs(cache)
+    # Create directory for sandbox and image layers
+    os.makedirs(cache, exist_ok=True)
 
     # Run on compute node or instance without submitting jobs to a scheduler
     if mode == "local":
@@ -106,7 +106,7 @@ def orchestrate(
         # Look into later: it maybe worth replacing Popen subprocess with a direct
         # snakemake API call: https://snakemake.readthedocs.io/en/stable/api_reference/snakemake.html
         # Create log file for pipeline
-        logfh = open(os.path.join(outdir, "logfiles", "snakemake.log"), "w")
+        logfh = open(logfile, "w")
         masterjob = subprocess.Popen(
             [
                 "snakemake",
@@ -119,6 +119,8 @@ def orchestrate(
                 "--configfile=config.json",
             ],
             cwd=outdir,
+            stderr=subprocess.STDOUT,
+            stdout=logfh,
             env=my_env,
         )
 
@@ -134,31 +136,26 @@ def orchestrate(
         #    2>&1| tee -a $R/Reports/snakemake.log
 
         # Create log file for master job information
-        logfh = open(os.path.join(outdir, "logfiles", "master.log"), "w")
+        logfh = open(os.path.join(logdir, "master.log"), "w")
         # submission_script for renee run is /path/to/output/resources/runner
         # submission_script for renee build is /path/to/output/resources/builder
         cmdlist = [
-            str(os.path.join(outdir, "resources", str(submission_script))),
+            os.path.join(outdir, "resources", submission_script),
             mode,
             "-j",
-            str(masterjob),
+            masterjob,
             "-b",
-            str(bindpaths),
+            bindpaths,
             "-o",
-            str(outdir),
+            outdir,
             "-c",
-            str(cache),
+            os.fspath(cache),
             "-t",
-            str(tmp_dir),
+            os.fspath(tmp_dir),
         ]
-        if str(wait) == "--wait":
+        if wait == "--wait":
             cmdlist.append("-w")
-        if str(hpcname) != "":
-            cmdlist.append("-n")
-            cmdlist.append(hpcname)
-        else:
-            cmdlist.append("-n")
-            cmdlist.append("unknown")
+        cmdlist += ["-n", hpcname or "unknown"]
 
         print(" ".join(cmdlist))
         masterjob = subprocess.Popen(
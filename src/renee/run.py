@@ -2,16 +2,14 @@ import contextlib
 import io
 import json
 import os
-import pathlib
+import re
 import sys
-from ccbr_tools.pipeline.util import get_hpcname, get_tmp_dir
+from ccbr_tools.pipeline.util import get_tmp_dir
 
-from .util import renee_base
+from .util import renee_base, get_hpcname, realpath
 from .conditions import fatal
 from .initialize import initialize
 from .setup import setup
-from .dryrun import dryrun
-from .orchestrate import orchestrate
 
 
 def run(sub_args):
@@ -52,10 +50,11 @@ def run(sub_args):
 
     # Optional Step: Dry-run pipeline
     if sub_args.dry_run:
-        dryrun_output = dryrun(
-            outdir=sub_args.output
-        )  # python3 returns byte-string representation
-        print("\nDry-running RENEE pipeline:\n{}".format(dryrun_output.decode("utf-8")))
+        from .dryrun import dryrun
+
+        # the output of the dryrun is streamed to stdout
+        print("\nDry-running RENEE pipeline:")
+        dryrun(outdir=sub_args.output)
         # sys.exit(0) # DONT exit now ... exit after printing singularity bind paths
 
     # determine "wait"
@@ -80,20 +79,22 @@ def run(sub_args):
     genome_bind_paths = resolve_additional_bind_paths(
         list(config["references"]["rnaseq"].values()) + fq_screen_paths + kraken_db_path
     )
-    all_bind_paths = "{},{}".format(",".join(genome_bind_paths), rawdata_bind_paths)
+    all_bind_paths = genome_bind_paths + rawdata_bind_paths.split(",")
 
     if sub_args.dry_run:  # print singularity bind baths and exit
-        print("\nSingularity Bind Paths:{}".format(all_bind_paths))
+        print("\nSingularity Bind Paths:{}".format(",".join(all_bind_paths)))
         # end at dry run
     else:  # continue with real run
         # Run pipeline
+        from .orchestrate import orchestrate
+
         masterjob = orchestrate(
             mode=sub_args.mode,
             outdir=sub_args.output,
             additional_bind_paths=all_bind_paths,
             alt_cache=sub_args.singularity_cache,
             threads=sub_args.threads,
-            tmp_dir=get_tmp_dir(sub_args.tmp_dir, sub_args.output),
+            tmp_dir=get_tmp_dir(sub_args.tmp_dir, sub_args.output, hpc=hpcname),
             wait=wait,
             hpcname=hpcname,
         )
@@ -110,8 +111,9 @@ def run(sub_args):
                 print("{} pipeline has successfully completed".format("RENEE"))
             else:
                 fatal(
-                    "{} pipeline failed. Please see standard output for more information.".format(
-                        "RENEE"
+                    "{} pipeline failed. Please see {} for more information.".format(
+                        "RENEE",
+                        os.path.join(sub_args.output, "logfiles", "snakemake.log"),
                     )
                 )
         elif sub_args.mode == "slurm":
@@ -150,20 +152,17 @@ def resolve_additional_bind_paths(search_paths):
         # Skip over resources with remote URI and
         # skip over strings that are not file PATHS as
         # RENEE build creates absolute resource PATHS
-        if (
-            ref.lower().startswith("sftp://")
-            or ref.lower().startswith("s3://")
-            or ref.lower().startswith("gs://")
-            or not ref.lower().startswith(os.sep)
-        ):
+        if not ref.startswith(os.sep):
             continue
 
         # Break up path into directory tokens
         for r in [
-            ref,
-            str(pathlib.Path(ref).resolve()),
-        ]:  # taking care of paths which are symlinks!
-            path_list = os.path.abspath(r).split(os.sep)
+            os.path.normpath(ref),
+            # taking care of paths which are symlinks!
+            # canonical parent directories are cached across refs
+            realpath(ref),
+        ]:
+            path_list = r.split(os.sep)
 
             try:  # Create composite index from first two directories
                 # Avoids issues created by shared /gpfs/ PATHS
@@ -179,10 +178,12 @@ def resolve_additional_bind_paths(search_paths):
             indexed_paths[index].append(str(os.sep).join(path_list))
 
     for index, paths in indexed_paths.items():
-        # Find common paths for each path index
-        common_paths.append(os.path.dirname(os.path.commonprefix(paths)))
+        # Find common paths for each path index, compared
+        # by path components rather than by characters
+        common_paths.append(os.path.commonpath([os.path.dirname(p) for p in paths]))
 
-    return list(set(common_paths))
+    # Remove duplicates, keeping the order of first appearance
+    return list(dict.fromkeys(common_paths))
 
 
 def get_fastq_screen_paths(fastq_screen_confs, match="DATABASE", file_index=-1):
@@ -199,10 +200,10 @@ def get_fastq_screen_paths(fastq_screen_confs, match="DATABASE", file_index=-1):
         Returns a list of fastq_screen database paths
     """
     databases = []
+    # One regex scan per file finds every matching line
+    line_regex = re.compile("^{}.*$".format(re.escape(match)), re.MULTILINE)
     for file in fastq_screen_confs:
         with open(file, "r") as fh:
-            for line in fh:
-                if line.startswith(match):
-                    db_path = line.strip().split()[file_index]
-                    databases.append(db_path)
+            lines = line_regex.findall(fh.read())
+        databases.extend(line.split()[file_index] for line in lines)
     return databases
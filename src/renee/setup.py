@@ -4,13 +4,10 @@ import re
 import subprocess
 import sys
 
-from ccbr_tools.pipeline.util import (
-    get_hpcname,
-    get_tmp_dir,
-)
+from ccbr_tools.pipeline.util import get_tmp_dir
 from ccbr_tools.pipeline.cache import image_cache
 
-from .util import get_version
+from .util import get_version, get_hpcname
 
 
 def setup(sub_args, ifiles, repo_path, output_path):
@@ -85,7 +82,9 @@ def setup(sub_args, ifiles, repo_path, output_path):
     config["options"] = {}
     config["options"]["star_2_pass_basic"] = sub_args.star_2_pass_basic
     config["options"]["small_rna"] = sub_args.small_rna
-    config["options"]["tmp_dir"] = get_tmp_dir(sub_args.tmp_dir, output_path)
+    config["options"]["tmp_dir"] = get_tmp_dir(
+        sub_args.tmp_dir, output_path, hpc=hpcname
+    )
     config["options"]["shared_resources"] = sub_args.shared_resources
     if sub_args.wait:
         config["options"]["wait"] = "True"
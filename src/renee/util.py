@@ -1,22 +1,68 @@
+import functools
+import os
 import pathlib
-from ccbr_tools.pipeline.util import get_hpcname
+import re
+import sys
+import warnings
+
+# Covers common extensions from SF, SRA, EBI, TCGA, and external sequencing providers
+# first item = regex to match string and second item = how it will be renamed
+_fastq_extensions = [
+    # Matches: _R[12]_fastq.gz, _R[12].fastq.gz, _R[12]_fq.gz, etc.
+    (".R1.f(ast)?q.gz$", ".R1.fastq.gz"),
+    (".R2.f(ast)?q.gz$", ".R2.fastq.gz"),
+    # Matches: _R[12]_001_fastq_gz, _R[12].001.fastq.gz, _R[12]_001.fq.gz, etc.
+    # Capture lane information as named group
+    (".R1.(?P<lane>...).f(ast)?q.gz$", ".R1.fastq.gz"),
+    (".R2.(?P<lane>...).f(ast)?q.gz$", ".R2.fastq.gz"),
+    # Matches: _[12].fastq.gz, _[12].fq.gz, _[12]_fastq_gz, etc.
+    ("_1.f(ast)?q.gz$", ".R1.fastq.gz"),
+    ("_2.f(ast)?q.gz$", ".R2.fastq.gz"),
+]
+# All extensions in one regex, each one in a named group ext<i>. The lazy
+# prefix makes an earlier extension win wherever it matches in the filename,
+# same as searching for each extension in order.
+_fastq_extensions_regex = re.compile(
+    "|".join(
+        ".*?(?P<ext{0}>{1})".format(
+            i, regex.replace("?P<lane>", "?P<lane{}>".format(i))
+        )
+        for i, (regex, _) in enumerate(_fastq_extensions)
+    ),
+    re.DOTALL,
+)
+# Repository root, resolved once on import
+_SRC_FILE = pathlib.Path(__file__).absolute()
+_BASEDIR = str(_SRC_FILE.parent.parent.parent)
 
 
 def renee_base(*paths, debug=False):
     """Get the absolute path to a file in the repository
     @return abs_path <str>
     """
-    src_file = pathlib.Path(__file__).absolute()
     if debug:
-        print("SRC FILE:", src_file)
-    basedir = src_file.parent.parent.parent
-    return str(basedir.joinpath(*paths))
+        print("SRC FILE:", _SRC_FILE)
+    return os.path.join(_BASEDIR, *paths)
 
 
 def get_version(debug=False):
     """Get the current RENEE version
+    @param debug <bool>:
+        Print the path of the VERSION file and read it again
     @return version <str>
     """
+    if debug:
+        # Bypass the cache so the file is reported and read every time
+        return _read_version(debug=True)
+    return _cached_version()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_version():
+    return _read_version()
+
+
+def _read_version(debug=False):
     version_file = renee_base("VERSION")
     if debug:
         print("VERSION FILE:", version_file)
@@ -25,8 +71,50 @@ def get_version(debug=False):
     return version
 
 
-def get_shared_resources_dir(shared_dir, hpc=get_hpcname()):
+@functools.lru_cache(maxsize=1)
+def scontrol_show():
+    """Get the SLURM configuration of the current cluster, queried once per process
+    @return scontrol_dict <dict>:
+        Parameters from `scontrol show config`, empty if SLURM is not available
+    """
+    # imported on use to keep CLI start-up fast
+    import shutil
+    import subprocess
+
+    scontrol_dict = {}
+    scontrol = shutil.which("scontrol")
+    if scontrol is None:
+        return scontrol_dict
+    # Run scontrol directly, without a shell in between
+    scontrol_out = subprocess.run(
+        [scontrol, "show", "config"], capture_output=True, text=True, check=False
+    ).stdout
+    for line in scontrol_out.split("\n"):
+        line_split = line.split("=")
+        if len(line_split) > 1:
+            scontrol_dict[line_split[0].strip()] = line_split[1].strip()
+    return scontrol_dict
+
+
+@functools.lru_cache(maxsize=1)
+def get_hpcname():
+    """Get the name of the current HPC, queried from SLURM once per process.
+    renee looks up the HPC only through this function and passes the result
+    as hpc= to ccbr_tools helpers, whose own lookup is uncached and runs
+    scontrol through a shell.
+    @return hpcname <str>:
+        "biowulf", "frce", or blank if not run on either cluster
+    """
+    hpc = scontrol_show().get("ClusterName", "")
+    if hpc == "fnlcr":
+        hpc = "frce"
+    return hpc
+
+
+def get_shared_resources_dir(shared_dir, hpc=None):
     """Get default shared resources directory for biowulf and frce. Allow user override."""
+    if hpc is None:
+        hpc = get_hpcname()
     if not shared_dir:
         if hpc == "biowulf":
             shared_dir = (
@@ -35,3 +123,168 @@ def get_shared_resources_dir(shared_dir, hpc=get_hpcname()):
         elif hpc == "frce":
             shared_dir = "/mnt/projects/CCBR-Pipelines/pipelines/RENEE/resources/shared_resources"
     return shared_dir
+
+
+def get_genomes_dict(hpcname=None, error_on_warnings=False):
+    """Get the prebuilt genome+annotation JSONs for an HPC.
+    The listing is cached and only re-scanned when the mtime of the
+    config/genomes/<hpcname> directory changes.
+    @param hpcname <str>:
+        Name of the HPC, defaults to the current cluster
+    @param error_on_warnings <bool>:
+        Raise warnings as errors
+    @return genomes_dict <dict>:
+        Genome+annotation names mapped to the paths of their JSON files,
+        sorted by name
+    """
+    return _get_genomes_dict(hpcname, error_on_warnings, stacklevel=2)
+
+
+def get_genomes_list(hpcname=None, error_on_warnings=False):
+    """Get list of genome annotations available for the current platform
+    @param hpcname <str>:
+        Name of the HPC, defaults to the current cluster
+    @param error_on_warnings <bool>:
+        Raise warnings as errors
+    @return genomes_list <list>:
+        Sorted names of the prebuilt genome+annotation combinations
+    """
+    return list(_get_genomes_dict(hpcname, error_on_warnings, stacklevel=2))
+
+
+def _get_genomes_dict(hpcname, error_on_warnings, stacklevel):
+    # stacklevel is counted from the public function that was called,
+    # each private frame in between adds one
+    if hpcname is None:
+        hpcname = get_hpcname()
+    genomes_dir = renee_base("config", "genomes", hpcname)
+    try:
+        mtime = os.stat(genomes_dir).st_mtime_ns
+    except FileNotFoundError:
+        _warn(
+            f"Folder does not exist: {genomes_dir}", error_on_warnings, stacklevel + 1
+        )
+        genomes_dict = {}
+    else:
+        genomes_dict = dict(_scan_genomes_dir(genomes_dir, mtime))
+    if not genomes_dict:
+        _warn(
+            f"No Genome+Annotation JSONs found in {genomes_dir}. "
+            "Please specify a custom genome json file with `--genome`",
+            error_on_warnings,
+            stacklevel + 1,
+        )
+    return genomes_dict
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_genomes_dir(genomes_dir, mtime):
+    # mtime is only part of the cache key, a new mtime forces a re-scan
+    with os.scandir(genomes_dir) as entries:
+        genomes = [
+            (entry.name[: -len(".json")], entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+    return dict(sorted(genomes))
+
+
+def _warn(message, error_on_warnings=False, stacklevel=1):
+    if error_on_warnings:
+        raise UserWarning(message)
+    warnings.warn(message, stacklevel=stacklevel + 1)
+
+
+def realpath(path):
+    """Get the canonical path of a file, resolving symlinks.
+    Files that are not symlinks themselves reuse the cached canonical path of
+    their parent directory, so many files in the same directory only resolve
+    the directory's path components once.
+    @param path <str>:
+        Path to resolve
+    @return realpath <str>:
+        Absolute canonical path
+    """
+    path = os.path.abspath(path)
+    if os.path.islink(path):
+        return os.path.realpath(path)
+    parent, basename = os.path.split(path)
+    return os.path.join(_realpath_dir(parent), basename)
+
+
+@functools.lru_cache(maxsize=256)
+def _realpath_dir(path):
+    return os.path.realpath(path)
+
+
+def rename(filename):
+    """Dynamically renames FastQ file to have one of the following extensions: *.R1.fastq.gz, *.R2.fastq.gz
+    To automatically rename the fastq files, a few assumptions are made. If the extension of the
+    FastQ file cannot be infered, an exception is raised telling the user to fix the filename
+    of the fastq files.
+    @param filename <str>:
+        Original name of file to be renamed
+    @return filename <str>:
+        A renamed FastQ filename
+    """
+    if filename.endswith((".R1.fastq.gz", ".R2.fastq.gz")):
+        # Filename is already in the correct format
+        return filename
+
+    # All extensions end with "q", any character, and "gz",
+    # anything else cannot match and skips the regex
+    matched = None
+    if filename.endswith("gz") and filename[-4:-3] == "q":
+        # One scan finds the first extension that matches
+        matched = _fastq_extensions_regex.match(filename)
+    if not matched:
+        raise NameError(
+            """\n\tFatal: Failed to rename provided input '{}'!
+        Cannot determine the extension of the user provided input file.
+        Please rename the file list above before trying again.
+        Here is example of acceptable input file extensions:
+          sampleName.R1.fastq.gz      sampleName.R2.fastq.gz
+          sampleName_R1_001.fastq.gz  sampleName_R2_001.fastq.gz
+          sampleName_1.fastq.gz       sampleName_2.fastq.gz
+        Please also check that your input files are gzipped?
+        If they are not, please gzip them before proceeding again.
+        """.format(
+                filename, sys.argv[0]
+            )
+        )
+
+    group = matched.lastgroup
+    index = int(group[len("ext") :])
+    new_ext = _fastq_extensions[index][1]
+    # Retain lane information in the new file extension
+    # https://support.illumina.com/help/BaseSpace_OLH_009008/Content/Source/Informatics/BS/NamingConvention_FASTQ-files-swBS.htm#
+    lane = matched.groupdict().get("lane{}".format(index))
+    if lane is not None:
+        new_ext = "_{}{}".format(lane, new_ext)
+
+    return filename[: matched.start(group)] + new_ext + filename[matched.end(group) :]
+
+
+def _sym_safe_(input_data, target):
+    """Creates re-named symlinks for each FastQ file provided
+    as input. If a symlink already exists, it will not try to create a new symlink.
+    If relative source PATH is provided, it will be converted to an absolute PATH.
+    @param input_data <list[<str>]>:
+        List of input files to symlink to target location
+    @param target <str>:
+        Target path to copy templates and required resources
+    @return input_fastqs list[<str>]:
+        List of renamed input FastQs
+    """
+    input_fastqs = []  # store renamed fastq file names
+    for file in input_data:
+        filename = os.path.basename(file)
+        renamed = os.path.join(target, rename(filename))
+        input_fastqs.append(renamed)
+
+        if not os.path.lexists(renamed):
+            # Create a symlink if it does not already exist,
+            # the canonical path of the parent directory is cached
+            os.symlink(realpath(file), renamed)
+
+    return input_fastqs
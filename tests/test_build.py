@@ -7,10 +7,15 @@ import tempfile
 from renee.src.renee.__main__ import build
 
 renee_build = (
-    "./bin/renee build "
-    "--dry-run "
-    "--ref-name test "
-    "--ref-fa .tests/KO_S3.R1.fastq.gz "
-    "--ref-gtf .tests/KO_S3.R1.fastq.gz "
-    "--gtf-ver 0 "
+    "./bin/renee",
+    "build",
+    "--dry-run",
+    "--ref-name",
+    "test",
+    "--ref-fa",
+    ".tests/KO_S3.R1.fastq.gz",
+    "--ref-gtf",
+    ".tests/KO_S3.R1.fastq.gz",
+    "--gtf-ver",
+    "0",
 )
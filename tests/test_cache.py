@@ -1,33 +1,50 @@
-import tempfile
+import glob
 import json
-import os.path
 import subprocess
 
 from ccbr_tools.pipeline.cache import get_sif_cache_dir, get_singularity_cachedir
-from ccbr_tools.shell import shell_run
 
 renee_run = (
-    "./bin/renee run "
-    "--mode local --runmode init --dry-run "
-    "--input .tests/*.fastq.gz "
-    "--genome config/genomes/biowulf/hg38_30.json "
+    "./bin/renee",
+    "run",
+    "--mode",
+    "local",
+    "--runmode",
+    "init",
+    "--dry-run",
+    "--input",
+    *sorted(glob.glob(".tests/*.fastq.gz")),
+    "--genome",
+    "config/genomes/biowulf/hg38_30.json",
 )
 
 
-def run_in_temp(command_str):
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        outdir = os.path.join(tmp_dir, "testout")
-        output = shell_run(f"{command_str} --output {outdir}")
-        if os.path.exists(os.path.join(outdir, "config.json")):
-            with open(os.path.join(outdir, "config.json"), "r") as infile:
-                config = json.load(infile)
-        else:
-            config = None
+def run_cmd(argv):
+    """Runs a command without a /bin/sh in between.
+    @param argv list[<str>]:
+        Command and its arguments
+    @return output <str>:
+        Standard output and standard error of the command
+    """
+    output = subprocess.run(argv, capture_output=True, text=True)
+    return "\n".join([output.stdout, output.stderr])
+
+
+def run_in_temp(argv, tmp_path):
+    outdir = tmp_path / "testout"
+    output = run_cmd([*argv, "--output", str(outdir)])
+    config_file = outdir / "config.json"
+    if config_file.exists():
+        config = json.loads(config_file.read_text())
+    else:
+        config = None
     return output, config
 
 
-def test_cache_sif():
-    output, config = run_in_temp(f"{renee_run} --sif-cache tests/data/sifs/")
+def test_cache_sif(tmp_path):
+    output, config = run_in_temp(
+        [*renee_run, "--sif-cache", "tests/data/sifs/"], tmp_path
+    )
     assertions = [
         config["images"]["arriba"].endswith(
             "tests/data/sifs/ccbr_arriba_2.0.0_v0.0.1.sif"
@@ -37,8 +54,8 @@ def test_cache_sif():
     assert all(assertions)
 
 
-def test_cache_nosif():
-    output, config = run_in_temp(f"{renee_run} --sif-cache not/a/path")
+def test_cache_nosif(tmp_path):
+    output, config = run_in_temp([*renee_run, "--sif-cache", "not/a/path"], tmp_path)
     assertions = [
         config["images"]["arriba"] == "docker://nciccbr/ccbr_arriba_2.0.0:v0.0.1"
     ]
@@ -63,8 +80,7 @@ def test_get_singularity_cachedir():
     assert not errors, "errors occurred:\n{}".format("\n".join(errors))
 
 
-def test_cache_in_temp():
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        outdir = os.path.join(tmp_dir, "testout")
-        output = shell_run(f"./bin/renee cache --sif-cache {outdir} --dry-run")
+def test_cache_in_temp(tmp_path):
+    outdir = tmp_path / "testout"
+    output = run_cmd(["./bin/renee", "cache", "--sif-cache", str(outdir), "--dry-run"])
     assert "Image will be pulled from" in output
@@ -1,55 +1,89 @@
+import contextlib
+import glob
+import io
 import json
-import os.path
 import subprocess
-import tempfile
+import sys
+import warnings
 from renee.src.renee.__main__ import main
 
 renee_run = (
-    "./main.py run "
-    "--mode local --runmode init --dry-run "
-    "--input .tests/*.fastq.gz "
+    "run",
+    "--mode",
+    "local",
+    "--runmode",
+    "init",
+    "--dry-run",
+    "--input",
+    *sorted(glob.glob(".tests/*.fastq.gz")),
 )
 
 
-def run_in_temp(command_str):
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        outdir = os.path.join(tmp_dir, "testout")
-        output = subprocess.run(
-            f"{command_str} --output {outdir}",
-            capture_output=True,
-            shell=True,
-            text=True,
+def run_renee(argv):
+    """Runs the renee CLI in-process instead of in a new interpreter.
+    @param argv list[<str>]:
+        Command-line arguments, without the program name
+    @return output <subprocess.CompletedProcess>:
+        Exit code and captured stdout/stderr of the command
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    sys_argv = sys.argv
+    sys.argv = ["renee", *argv]
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+            stderr
+        ), warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                main()
+            except SystemExit as e:
+                # exit the same way the interpreter would
+                if isinstance(e.code, str):
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+                else:
+                    returncode = e.code or 0
+    finally:
+        sys.argv = sys_argv
+    # pytest records warnings instead of printing them
+    for warning in caught:
+        stderr.write(
+            warnings.formatwarning(
+                warning.message, warning.category, warning.filename, warning.lineno
+            )
         )
-        if os.path.exists(os.path.join(outdir, "config.json")):
-            with open(os.path.join(outdir, "config.json"), "r") as infile:
-                config = json.load(infile)
-        else:
-            config = None
+    return subprocess.CompletedProcess(
+        ["renee", *argv], returncode, stdout.getvalue(), stderr.getvalue()
+    )
+
+
+def run_in_temp(argv, tmp_path):
+    outdir = tmp_path / "testout"
+    output = run_renee([*argv, "--output", str(outdir)])
+    config_file = outdir / "config.json"
+    if config_file.exists():
+        config = json.loads(config_file.read_text())
+    else:
+        config = None
     return output, config
 
 
 def test_help():
-    output = subprocess.run(
-        "./bin/renee --help", capture_output=True, shell=True, text=True
-    ).stdout
+    output = run_renee(["--help"]).stdout
     assert "RENEE" in output
 
 
 def test_version():
-    output = subprocess.run(
-        "./bin/renee --version", capture_output=True, shell=True, text=True
-    ).stdout
+    output = run_renee(["--version"]).stdout
     assert "renee v" in output
 
 
 def test_run_error():
     assert (
         "the following arguments are required: --output"
-        in subprocess.run(
-            f"{renee_run} --genome config/genomes/biowulf/hg38_36.json",
-            capture_output=True,
-            shell=True,
-            text=True,
+        in run_renee(
+            [*renee_run, "--genome", "config/genomes/biowulf/hg38_36.json"]
         ).stderr
     )
 
@@ -57,25 +91,34 @@ def test_run_error():
 def test_subcommands_help():
     assert all(
         [
-            f"renee {cmd } [--help]"
-            in subprocess.run(
-                f"./bin/renee {cmd} --help",
-                capture_output=True,
-                shell=True,
-                text=True,
-            ).stdout
+            f"renee {cmd } [--help]" in run_renee([cmd, "--help"]).stdout
             for cmd in ["run", "build", "cache", "unlock"]
         ]
     )
 
 
-def test_default_genome():
-    output, config = run_in_temp(renee_run)
+def test_default_genome(tmp_path):
+    output, config = run_in_temp(renee_run, tmp_path)
     assert "No Genome+Annotation JSONs found" in output.stderr
 
 
-def test_genome_param():
+def test_genome_param(tmp_path):
     output, config = run_in_temp(
-        f"{renee_run} --genome config/genomes/biowulf/hg19_19.json"
+        [*renee_run, "--genome", "config/genomes/biowulf/hg19_19.json"], tmp_path
     )
     assert "hg19" in config["references"]["rnaseq"]["FUSIONBLACKLIST"]
+
+
+def test_missing_input(tmp_path):
+    output, config = run_in_temp(
+        [
+            "run",
+            "--input",
+            ".tests/KO_S3.R1.fastq.gz",
+            ".tests/missing.R1.fastq.gz",
+            "--genome",
+            "config/genomes/biowulf/hg38_36.json",
+        ],
+        tmp_path,
+    )
+    assert "'.tests/missing.R1.fastq.gz' do not exist" in output.stderr
@@ -0,0 +1,57 @@
+import gzip
+
+import pytest
+
+from renee.workflow.scripts.phred_encoding import decoded, main
+
+# quality scores of the second read decide the encoding,
+# the first read only has characters shared by both encodings
+phred33_fastq = b"@r1\nACGT\n+\nJJJJ\n@r2\nACGT\n+\nJJ#J\n"
+phred64_fastq = b"@r1\nACGT\n+\nJJJJ\n@r2\nACGT\n+\nJJhJ\n"
+ambiguous_fastq = b"@r1\nACGT\n+\nJJJJ\n@r2\nACGT\n+\nAB@J\n"
+
+
+@pytest.fixture(scope="session")
+def fastq_dir(tmp_path_factory):
+    # the FastQ files are only read, write them once for all tests
+    fastq_dir = tmp_path_factory.mktemp("phred")
+    for name, content in [
+        ("phred33", phred33_fastq),
+        ("phred64", phred64_fastq),
+        ("ambiguous", ambiguous_fastq),
+    ]:
+        with gzip.open(fastq_dir / f"{name}.R1.fastq.gz", "wb") as fastq:
+            fastq.write(content)
+        (fastq_dir / f"{name}.R1.fastq").write_bytes(content)
+    return fastq_dir
+
+
+@pytest.mark.parametrize("extension", [".fastq.gz", ".fastq"])
+@pytest.mark.parametrize(
+    "name,encoding",
+    [("phred33", "33"), ("phred64", "64"), ("ambiguous", "33")],
+)
+def test_main(fastq_dir, name, extension, encoding):
+    assert main(str(fastq_dir / f"{name}.R1{extension}")) == encoding
+
+
+@pytest.mark.parametrize(
+    "qscore,encoding",
+    [
+        ("AAAFFJJ7JJ", "33"),
+        ("!#%0?", "33"),
+        ("JJJJhJJ", "64"),
+        ("KLMi", "64"),
+        # the first unique character decides
+        ("J#h", "33"),
+        ("Jh#", "64"),
+        # characters shared by both encodings
+        ("@ABCDEFGHIJ", ""),
+        ("", ""),
+        (b"JJ#J\n", "33"),
+        (b"JJhJ\n", "64"),
+        (b"JJJJ\n", ""),
+    ],
+)
+def test_decoded(qscore, encoding):
+    assert decoded(qscore) == encoding
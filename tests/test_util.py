@@ -1,9 +1,7 @@
 import contextlib
 import io
 import os
-import pathlib
 import pytest
-import tempfile
 import warnings
 
 from ccbr_tools.pipeline.util import (
@@ -12,7 +10,15 @@ from ccbr_tools.pipeline.util import (
     get_genomes_list,
 )
 
-from renee.src.renee.util import renee_base
+from renee.src.renee.util import (
+    renee_base,
+    rename,
+    _sym_safe_,
+    get_hpcname,
+    scontrol_show,
+)
+from renee.src.renee.util import get_genomes_list as renee_get_genomes_list
+from renee.src.renee import util as renee_util
 
 
 def test_renee_base():
@@ -20,35 +26,33 @@ def test_renee_base():
     assert str(renee_bin).endswith("/bin/renee") and os.path.exists(renee_bin)
 
 
-def test_cp_safe():
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        outdir = os.path.join(tmp_dir, "testout")
-        os.makedirs(os.path.join(outdir, "config"))
-        pathlib.Path(os.path.join(outdir, "config", "tmp.txt")).touch()
-        with contextlib.redirect_stdout(io.StringIO()) as stdout:
-            _cp_r_safe_(
-                source=renee_base(),
-                target=outdir,
-                resources=["config"],
-                safe_mode=True,
-            )
-        assert "path exists and `safe_mode` is ON, not copying" in stdout.getvalue()
-
-
-def test_cp_unsafe():
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        outdir = os.path.join(tmp_dir, "testout")
-        configdir = os.path.join(outdir, "config")
-        os.makedirs(configdir)
-        pathlib.Path(os.path.join(configdir, "tmp.txt")).touch()
-        with contextlib.redirect_stdout(io.StringIO()) as stdout:
-            _cp_r_safe_(
-                source=renee_base(),
-                target=outdir,
-                resources=["config"],
-                safe_mode=False,
-            )
-        assert not stdout.getvalue() and "config.yaml" in os.listdir(configdir)
+def test_cp_safe(tmp_path):
+    outdir = tmp_path / "testout"
+    (outdir / "config").mkdir(parents=True)
+    (outdir / "config" / "tmp.txt").touch()
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        _cp_r_safe_(
+            source=renee_base(),
+            target=str(outdir),
+            resources=["config"],
+            safe_mode=True,
+        )
+    assert "path exists and `safe_mode` is ON, not copying" in stdout.getvalue()
+
+
+def test_cp_unsafe(tmp_path):
+    outdir = tmp_path / "testout"
+    configdir = outdir / "config"
+    configdir.mkdir(parents=True)
+    (configdir / "tmp.txt").touch()
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        _cp_r_safe_(
+            source=renee_base(),
+            target=str(outdir),
+            resources=["config"],
+            safe_mode=False,
+        )
+    assert not stdout.getvalue() and "config.yaml" in os.listdir(configdir)
 
 
 def test_get_genomes_warnings():
@@ -78,3 +82,69 @@ def test_get_genomes_error():
 def test_get_genomes_biowulf():
     genomes_dict = get_genomes_dict(repo_base=renee_base, hpcname="biowulf")
     assert len(genomes_dict) > 10
+
+
+def test_renee_get_genomes_list():
+    genomes = renee_get_genomes_list(hpcname="biowulf")
+    assert "hg38_36" in genomes and genomes == sorted(genomes)
+    assert genomes == renee_get_genomes_list(hpcname="biowulf")
+
+
+def test_renee_get_genomes_list_error():
+    with pytest.raises(UserWarning) as exception_info:
+        renee_get_genomes_list(hpcname="notAnOption", error_on_warnings=True)
+    assert "Folder does not exist" in str(exception_info.value)
+
+
+@pytest.mark.parametrize("get_genomes", ["get_genomes_list", "get_genomes_dict"])
+def test_renee_get_genomes_warning_location(get_genomes):
+    with warnings.catch_warnings(record=True) as raised_warnings:
+        warnings.simplefilter("always")
+        getattr(renee_util, get_genomes)(hpcname="notAnOption")
+    # warnings point at the caller, not at renee's util module
+    assert [warning.filename for warning in raised_warnings] == [__file__] * 2
+
+
+@pytest.mark.parametrize(
+    "filename,renamed",
+    [
+        ("sample.R1.fastq.gz", "sample.R1.fastq.gz"),
+        ("sample_R2.fq.gz", "sample.R2.fastq.gz"),
+        ("sample_R1_001.fastq.gz", "sample_001.R1.fastq.gz"),
+        ("sample_R2_001_fq.gz", "sample_001.R2.fastq.gz"),
+        ("sample_1.fastq.gz", "sample.R1.fastq.gz"),
+        ("sample_2.fq.gz", "sample.R2.fastq.gz"),
+    ],
+)
+def test_rename(filename, renamed):
+    assert rename(filename) == renamed
+
+
+def test_rename_error():
+    with pytest.raises(NameError) as exception_info:
+        rename("sample.fastq")
+    assert "Failed to rename provided input 'sample.fastq'" in str(exception_info.value)
+
+
+def test_sym_safe(tmp_path):
+    fastq = tmp_path / "sample_R1_001.fastq.gz"
+    fastq.touch()
+    outdir = tmp_path / "out"
+    outdir.mkdir()
+    renamed = _sym_safe_(input_data=[str(fastq)], target=str(outdir))
+    # an existing symlink is left as is
+    assert renamed == _sym_safe_(input_data=[str(fastq)], target=str(outdir))
+    assert renamed == [str(outdir / "sample_001.R1.fastq.gz")]
+    assert os.path.realpath(renamed[0]) == os.path.realpath(fastq)
+
+
+def test_get_hpcname_without_slurm(monkeypatch):
+    monkeypatch.setattr("shutil.which", lambda cmd: None)
+    scontrol_show.cache_clear()
+    get_hpcname.cache_clear()
+    try:
+        assert scontrol_show() == {}
+        assert get_hpcname() == ""
+    finally:
+        scontrol_show.cache_clear()
+        get_hpcname.cache_clear()
@@ -2,7 +2,7 @@
 # -*- coding: UTF-8 -*-
 
 from __future__ import print_function, division
-import sys, gzip
+import os, sys, gzip, itertools, re
 
 # USAGE
 # sys.argv[1] = sample_name.R1.fastq.gz
@@ -21,6 +21,14 @@ import sys, gzip
 # +
 # AAAFFJJFJJJJJJFJJJJJJJJJJFJAJJJJJFJJJJJFFJJAJJJJ7JJ <- Determine if Phred-33 encoding or Phred-64
 
+# Unique set of characters across both Phred encoding types,
+# '!' to '?' only occur in Phred-33 and 'K' to 'i' only in Phred-64
+_encodings = re.compile(r"(?P<phred33>[!-?])|(?P<phred64>[K-i])")
+_encodings_bytes = re.compile(_encodings.pattern.encode("ascii"))
+
+# File handlers for compressed FastQ files by extension
+_readers = {".gz": gzip.open}
+
 
 def usage(message="", exitcode=0):
     """Displays help and usage information. If provided invalid usage
@@ -38,92 +46,45 @@ def reader(fname):
     or non-gzipped FastQ files based on the file extension. Assumes
     gzipped files endwith the '.gz' extension.
     """
-    if fname.endswith(".gz"):
-        # Opens up file with gzip handler
-        return gzip.open
-    else:
-        # Opens up file normal, uncompressed handler
-        return open
+    # Opens up file with gzip handler, or normal, uncompressed
+    # handler for any other extension
+    return _readers.get(os.path.splitext(fname)[1], open)
 
 
 def decoded(qscore):
     """Returns Phred ASCII encoding type of FastQ quality scores.
-    Older FastQ files may use Phred 64 encoding.
+    Older FastQ files may use Phred 64 encoding. Quality scores
+    can be given as text or as bytes read in binary mode.
     """
-    encoding = ""
-    # Unique set of characters across both Phred encoding types
-    encodings = {  # Pred-33 Encoding characters
-        "!": "33",
-        "#": "33",
-        '"': "33",
-        "%": "33",
-        "$": "33",
-        "'": "33",
-        "&": "33",
-        ")": "33",
-        "(": "33",
-        "+": "33",
-        "*": "33",
-        "-": "33",
-        ",": "33",
-        "/": "33",
-        ".": "33",
-        "1": "33",
-        "0": "33",
-        "3": "33",
-        "2": "33",
-        "5": "33",
-        "4": "33",
-        "7": "33",
-        "6": "33",
-        "9": "33",
-        "8": "33",
-        ";": "33",
-        ":": "33",
-        "=": "33",
-        "<": "33",
-        "?": "33",
-        ">": "33",
-        # Pred-64 Encoding characters
-        "K": "64",
-        "M": "64",
-        "L": "64",
-        "O": "64",
-        "N": "64",
-        "Q": "64",
-        "P": "64",
-        "S": "64",
-        "R": "64",
-        "U": "64",
-        "T": "64",
-        "W": "64",
-        "V": "64",
-        "Y": "64",
-        "X": "64",
-        "[": "64",
-        "Z": "64",
-        "]": "64",
-        "\\": "64",
-        "_": "64",
-        "^": "64",
-        "a": "64",
-        "`": "64",
-        "c": "64",
-        "b": "64",
-        "e": "64",
-        "d": "64",
-        "g": "64",
-        "f": "64",
-        "i": "64",
-        "h": "64",
-    }
-
-    for char in qscore:
-        try:
-            encoding = encodings[char]
-            break
-        except KeyError:
-            pass
+    # The first character unique to either Phred encoding type
+    # determines the encoding, found in one scan of the regex engine
+    encodings = _encodings_bytes if isinstance(qscore, bytes) else _encodings
+    match = encodings.search(qscore)
+    if match is None:
+        return ""
+    return match.lastgroup[len("phred") :]
+
+
+def main(filename):
+    """Returns Phred ASCII encoding type of a FastQ file. Reading stops
+    at the first quality score that determines the encoding, Phred-33
+    is assumed if no quality score is unique to either encoding type.
+    """
+    # Set handler for gzipped or uncompressed file
+    handle = reader(filename)
+    # Default encoding if not found
+    encoding = "33"
+
+    # Open in 'rb' mode to skip decoding the text, which works the
+    # same across python2 and python3, and only visit the quality
+    # scores, every fourth line starting at the fourth line
+    with handle(filename, "rb") as fastq:
+        for line in itertools.islice(fastq, 3, None, 4):
+            encoded = decoded(line)
+            if encoded:
+                # Found Phred ASCII encoding type (33 vs. 64)
+                encoding = encoded
+                break  # Stop Iteration
 
     return encoding
 
@@ -141,24 +102,5 @@ if __name__ == "__main__":
     # Get file name
     filename = sys.argv[1]
 
-    # Set handler for gzipped or uncompressed file
-    handle = reader(filename)
-    # Default encoding if not found
-    encoding = "33"
-
-    # Open in 'rt' mode to maintain compatibility across python2 and python3
-    # python3 default mode is 'rb' and will return a byte string representation
-    with handle(filename, "rt") as fastq:
-        i = 0
-        for line in fastq:
-            line = line.strip()
-            if i % 4 == 3:  # Quality scores
-                encoded = decoded(line)
-                if encoded:
-                    # Found Phred ASCII encoding type (33 vs. 64)
-                    encoding = encoded
-                    break  # Stop Iteration
-            i += 1
-
     # Print encoding to standard output
-    print(encoding)
+    print(main(filename))